@@ -73,7 +73,8 @@ CREATE TABLE IF NOT EXISTS edges (
     last_coactivated REAL,
     FOREIGN KEY (source_id) REFERENCES nodes(id),
     FOREIGN KEY (target_id) REFERENCES nodes(id),
-    UNIQUE(source_id, target_id)
+    UNIQUE(source_id, target_id),
+    CHECK(source_id < target_id)
 );
 
 CREATE TABLE IF NOT EXISTS memories (
@@ -259,8 +260,8 @@ def save_memory(conn: sqlite3.Connection, content: str, activations: list,
         )
         conn.execute(
             "UPDATE nodes SET activation_count = activation_count + 1, "
-            "last_activated = CURRENT_TIMESTAMP WHERE id = ?",
-            (act["node_id"],)
+            "last_activated = ? WHERE id = ?",
+            (now, act["node_id"])
         )
 
     # Hebbian edge strengthening
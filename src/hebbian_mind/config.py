@@ -11,6 +11,28 @@ import platform
 from pathlib import Path
 from typing import Optional
 
+# Patterns to scrub from error messages (order matters - more specific first)
+_SANITIZE_PATTERNS = [
+    # Windows paths
+    (re.compile(r"[A-Za-z]:\\Users\\[^\\]+\\"), ""),  # C:\Users\username\
+    (re.compile(r"[A-Za-z]:\\[Pp]rogram [Ff]iles[^\\]*\\"), ""),  # C:\Program Files\
+    (re.compile(r"[A-Za-z]:\\[Ww]indows\\"), ""),  # C:\Windows\
+    (re.compile(r"[A-Za-z]:\\[^\\]+\\"), ""),  # Any other drive root
+    # Linux/Unix paths
+    (re.compile(r"/home/[^/]+/"), ""),  # /home/username/
+    (re.compile(r"/app/"), ""),  # Docker /app/
+    (re.compile(r"/opt/[^/]+/"), ""),  # /opt/package/
+    (re.compile(r"/usr/local/"), ""),  # /usr/local/
+    (re.compile(r"/var/[^/]+/"), ""),  # /var/lib/, /var/log/, etc
+    (re.compile(r"/tmp/"), ""),  # /tmp/
+    # Generic patterns (fallback)
+    (re.compile(r'File "[^"]+",'), 'File "<path>",'),  # Python traceback file references
+    (re.compile(r"File '[^']+',"), "File '<path>',"),  # Python traceback (single quotes)
+]
+
+# Single alternation of every pattern above, used as a cheap "anything to scrub?" check
+_SANITIZE_ANY = re.compile("|".join(pattern.pattern for pattern, _ in _SANITIZE_PATTERNS))
+
 
 def sanitize_error_message(error: Exception) -> str:
     """Sanitize error messages to prevent internal path leakage.
@@ -19,6 +41,9 @@ def sanitize_error_message(error: Exception) -> str:
     are returned to customers. This prevents exposing server
     filesystem structure in error responses.
 
+    Messages that contain no scrubbable path are returned as-is,
+    without running the individual substitution passes.
+
     Args:
         error: The exception to sanitize
 
@@ -27,27 +52,11 @@ def sanitize_error_message(error: Exception) -> str:
     """
     message = str(error)
 
-    # Patterns to scrub (order matters - more specific first)
-    patterns = [
-        # Windows paths
-        (r"[A-Za-z]:\\Users\\[^\\]+\\", ""),  # C:\Users\username\
-        (r"[A-Za-z]:\\[Pp]rogram [Ff]iles[^\\]*\\", ""),  # C:\Program Files\
-        (r"[A-Za-z]:\\[Ww]indows\\", ""),  # C:\Windows\
-        (r"[A-Za-z]:\\[^\\]+\\", ""),  # Any other drive root
-        # Linux/Unix paths
-        (r"/home/[^/]+/", ""),  # /home/username/
-        (r"/app/", ""),  # Docker /app/
-        (r"/opt/[^/]+/", ""),  # /opt/package/
-        (r"/usr/local/", ""),  # /usr/local/
-        (r"/var/[^/]+/", ""),  # /var/lib/, /var/log/, etc
-        (r"/tmp/", ""),  # /tmp/
-        # Generic patterns (fallback)
-        (r'File "[^"]+",', 'File "<path>",'),  # Python traceback file references
-        (r"File '[^']+',", "File '<path>',"),  # Python traceback file references (single quotes)
-    ]
-
-    for pattern, replacement in patterns:
-        message = re.sub(pattern, replacement, message)
+    if _SANITIZE_ANY.search(message) is None:
+        return message
+
+    for pattern, replacement in _SANITIZE_PATTERNS:
+        message = pattern.sub(replacement, message)
 
     return message
 
@@ -141,19 +150,29 @@ class Config:
         if cls.RAM_DATA_DIR and cls.RAM_DISK_ENABLED:
             cls.RAM_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Memoized results of get_decay_config() / summary(). The class attributes they
+    # read are evaluated once at import, so the cached values never go stale.
+    _decay_config_cache: Optional[dict] = None
+    _summary_cache: Optional[dict] = None
+
     @classmethod
     def get_decay_config(cls) -> dict:
-        """Return decay configuration as a dictionary."""
-        return {
-            "enabled": cls.DECAY_ENABLED,
-            "base_rate": cls.DECAY_BASE_RATE,
-            "threshold": cls.DECAY_THRESHOLD,
-            "immortal_threshold": cls.DECAY_IMMORTAL_THRESHOLD,
-            "sweep_interval_minutes": cls.DECAY_SWEEP_INTERVAL,
-            "edge_decay_enabled": cls.EDGE_DECAY_ENABLED,
-            "edge_decay_rate": cls.EDGE_DECAY_RATE,
-            "edge_decay_min_weight": cls.EDGE_DECAY_MIN_WEIGHT,
-        }
+        """Return decay configuration as a dictionary.
+
+        Built on first call and memoized; each caller gets its own copy.
+        """
+        if cls._decay_config_cache is None:
+            cls._decay_config_cache = {
+                "enabled": cls.DECAY_ENABLED,
+                "base_rate": cls.DECAY_BASE_RATE,
+                "threshold": cls.DECAY_THRESHOLD,
+                "immortal_threshold": cls.DECAY_IMMORTAL_THRESHOLD,
+                "sweep_interval_minutes": cls.DECAY_SWEEP_INTERVAL,
+                "edge_decay_enabled": cls.EDGE_DECAY_ENABLED,
+                "edge_decay_rate": cls.EDGE_DECAY_RATE,
+                "edge_decay_min_weight": cls.EDGE_DECAY_MIN_WEIGHT,
+            }
+        return dict(cls._decay_config_cache)
 
     @classmethod
     def check_ram_available(cls) -> bool:
@@ -172,21 +191,29 @@ class Config:
 
     @classmethod
     def summary(cls) -> dict:
-        """Return configuration summary"""
+        """Return configuration summary.
+
+        Static fields are memoized; ram_available is re-checked on every call.
+        """
+        if cls._summary_cache is None:
+            cls._summary_cache = {
+                "base_dir": str(cls.BASE_DIR),
+                "disk_data_dir": str(cls.DISK_DATA_DIR),
+                "disk_db_path": str(cls.DISK_DB_PATH),
+                "ram_enabled": cls.RAM_DISK_ENABLED,
+                "ram_data_dir": str(cls.RAM_DATA_DIR) if cls.RAM_DATA_DIR else None,
+                "ram_available": False,  # Placeholder, filled in per call
+                "faiss_enabled": cls.FAISS_TETHER_ENABLED,
+                "faiss_host": cls.FAISS_TETHER_HOST if cls.FAISS_TETHER_ENABLED else None,
+                "faiss_port": cls.FAISS_TETHER_PORT if cls.FAISS_TETHER_ENABLED else None,
+                "precog_enabled": cls.PRECOG_ENABLED,
+                "precog_path": str(cls.PRECOG_PATH) if cls.PRECOG_PATH else None,
+                "activation_threshold": cls.ACTIVATION_THRESHOLD,
+                "edge_strengthening_factor": cls.EDGE_STRENGTHENING_FACTOR,
+                "max_edge_weight": cls.MAX_EDGE_WEIGHT,
+            }
         return {
-            "base_dir": str(cls.BASE_DIR),
-            "disk_data_dir": str(cls.DISK_DATA_DIR),
-            "disk_db_path": str(cls.DISK_DB_PATH),
-            "ram_enabled": cls.RAM_DISK_ENABLED,
-            "ram_data_dir": str(cls.RAM_DATA_DIR) if cls.RAM_DATA_DIR else None,
+            **cls._summary_cache,
             "ram_available": cls.check_ram_available(),
-            "faiss_enabled": cls.FAISS_TETHER_ENABLED,
-            "faiss_host": cls.FAISS_TETHER_HOST if cls.FAISS_TETHER_ENABLED else None,
-            "faiss_port": cls.FAISS_TETHER_PORT if cls.FAISS_TETHER_ENABLED else None,
-            "precog_enabled": cls.PRECOG_ENABLED,
-            "precog_path": str(cls.PRECOG_PATH) if cls.PRECOG_PATH else None,
-            "activation_threshold": cls.ACTIVATION_THRESHOLD,
-            "edge_strengthening_factor": cls.EDGE_STRENGTHENING_FACTOR,
-            "max_edge_weight": cls.MAX_EDGE_WEIGHT,
             "decay": cls.get_decay_config(),
         }
@@ -224,7 +224,10 @@ class HebbianDecayEngine:
         conn = self.db.read_conn
         disk_conn = self.db.disk_conn
 
+        # Plain tuple rows: the sweep touches every memory, so skip sqlite3.Row wrapping.
+        # Set on the cursor only, leaving the shared connection's factory untouched.
         cursor = conn.cursor()
+        cursor.row_factory = None
         cursor.execute("""
             SELECT memory_id, importance, last_accessed, effective_importance
             FROM memories
@@ -232,11 +235,7 @@ class HebbianDecayEngine:
         """)
         rows = cursor.fetchall()
 
-        for row in rows:
-            memory_id = row["memory_id"]
-            importance = row["importance"]
-            last_accessed = row["last_accessed"]
-
+        for memory_id, importance, last_accessed, old_effective in rows:
             if importance >= self.config["immortal_threshold"]:
                 stats["memories_immortal"] += 1
                 stats["memories_swept"] += 1
@@ -247,7 +246,6 @@ class HebbianDecayEngine:
             )
 
             # Only update if value changed meaningfully (avoid unnecessary writes)
-            old_effective = row["effective_importance"]
             if old_effective is not None and abs(new_effective - old_effective) < 0.0001:
                 stats["memories_swept"] += 1
                 continue
@@ -300,10 +298,12 @@ class HebbianDecayEngine:
         disk_conn = self.db.disk_conn
         min_weight = self.config["edge_decay_min_weight"]
 
+        # Plain tuple rows, as in _sweep_memories
         cursor = conn.cursor()
+        cursor.row_factory = None
         cursor.execute(
             """
-            SELECT id, source_id, target_id, weight, last_strengthened
+            SELECT id, weight, last_strengthened
             FROM edges
             WHERE weight > ? AND last_strengthened IS NOT NULL
         """,
@@ -311,11 +311,7 @@ class HebbianDecayEngine:
         )
         rows = cursor.fetchall()
 
-        for row in rows:
-            edge_id = row["id"]
-            weight = row["weight"]
-            last_strengthened_str = row["last_strengthened"]
-
+        for edge_id, weight, last_strengthened_str in rows:
             # Convert timestamp string to epoch
             try:
                 last_strengthened = self._parse_timestamp(last_strengthened_str)
@@ -467,6 +463,7 @@ class HebbianDecayEngine:
         """
         conn = self.db.read_conn
         cursor = conn.cursor()
+        cursor.row_factory = None
 
         # Memory stats
         cursor.execute("SELECT COUNT(*) FROM memories")
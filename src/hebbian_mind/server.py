@@ -18,6 +18,7 @@ All rights reserved.
 """
 
 import asyncio
+import functools
 import json
 import re
 import sqlite3
@@ -25,10 +26,9 @@ import socket
 import sys
 import time
 import logging
-import shutil
 import threading
 import uuid
-from pathlib import Path
+from contextlib import closing
 from typing import Dict, List, Any, Optional
 from importlib import resources
 
@@ -83,6 +83,25 @@ def check_ram_available() -> bool:
 USE_RAM = check_ram_available()
 
 
+def _new_memory_id() -> str:
+    """Return a new memory ID: the prefix plus 64 random bits of a UUID4 as hex."""
+    return f"hebbian_mind_{uuid.uuid4().hex[:16]}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _keyword_pattern(keyword: str) -> "re.Pattern[str]":
+    """Return a compiled word-boundary matcher for a lowercased keyword.
+
+    Cached so each keyword is compiled once, not once per analyzed content.
+    """
+    return re.compile(r"\b" + re.escape(keyword) + r"\b")
+
+
+def _parse_terms(raw: str) -> "tuple[tuple[str, str], ...]":
+    """Decode a node's JSON keyword/phrase list into (term, lowercased term) pairs."""
+    return tuple((term, term.lower()) for term in json.loads(raw))
+
+
 class HebbianMindDatabase:
     """SQLite database for Hebbian neural graph with DUAL-WRITE support."""
 
@@ -96,6 +115,7 @@ class HebbianMindDatabase:
         self._coactivation_count = 0
         self._lock = threading.RLock()  # Serialize all DB access across threads
         self._decay_engine: Optional[HebbianDecayEngine] = None
+        self._node_vocab: Optional[tuple] = None  # (limit, decoded node terms) for analyze_content
 
         self._init_connections()
         self._init_schema()
@@ -112,15 +132,15 @@ class HebbianMindDatabase:
                 print(f"[HEBBIAN-MIND] Using RAM disk for reads: {self.ram_path}", file=sys.stderr)
                 self.using_ram = True
             elif self.disk_path.exists():
-                # RAM available but empty - copy from disk first
+                # RAM available but empty - copy from disk first. The online
+                # backup API yields a consistent snapshot including any
+                # un-checkpointed WAL pages, unlike a raw file copy.
                 try:
-                    shutil.copy2(self.disk_path, self.ram_path)
-                    # Copy WAL and SHM if they exist
-                    for ext in ["-wal", "-shm"]:
-                        disk_extra = Path(str(self.disk_path) + ext)
-                        ram_extra = Path(str(self.ram_path) + ext)
-                        if disk_extra.exists():
-                            shutil.copy2(disk_extra, ram_extra)
+                    with (
+                        closing(sqlite3.connect(str(self.disk_path))) as src,
+                        closing(sqlite3.connect(str(self.ram_path))) as dst,
+                    ):
+                        src.backup(dst)
                     print(f"[HEBBIAN-MIND] Copied disk DB to RAM: {self.ram_path}", file=sys.stderr)
                     self.using_ram = True
                 except Exception as e:
@@ -174,7 +194,8 @@ class HebbianMindDatabase:
                 last_strengthened TIMESTAMP,
                 FOREIGN KEY (source_id) REFERENCES nodes(id),
                 FOREIGN KEY (target_id) REFERENCES nodes(id),
-                UNIQUE(source_id, target_id)
+                UNIQUE(source_id, target_id),
+                CHECK(source_id < target_id)
             );
 
             -- Memories table
@@ -208,6 +229,7 @@ class HebbianMindDatabase:
             CREATE INDEX IF NOT EXISTS idx_edges_target_id ON edges(target_id);
             CREATE INDEX IF NOT EXISTS idx_memact_memory_id ON memory_activations(memory_id);
             CREATE INDEX IF NOT EXISTS idx_memact_node_id ON memory_activations(node_id);
+            CREATE INDEX IF NOT EXISTS idx_nodes_activation_count ON nodes(activation_count);
         """
 
         # Apply schema to read connection (RAM or disk)
@@ -365,6 +387,8 @@ class HebbianMindDatabase:
             self.disk_conn.execute(sql, params)
             self.disk_conn.commit()
 
+        self._node_vocab = None
+
     def _init_category_edges(self):
         """Initialize weak edges between nodes in same category."""
         cursor = self.read_conn.cursor()
@@ -443,6 +467,25 @@ class HebbianMindDatabase:
                 if not self._in_transaction:
                     self.read_conn.commit()
 
+    def _dual_write_many(self, sql: str, seq_of_params: List):
+        """executemany counterpart of _dual_write (same ordering and commit rules)."""
+        with self._lock:
+            if self.disk_conn:
+                self.disk_conn.executemany(sql, seq_of_params)
+                if not self._in_transaction:
+                    self.disk_conn.commit()
+
+                try:
+                    self.read_conn.executemany(sql, seq_of_params)
+                    if not self._in_transaction:
+                        self.read_conn.commit()
+                except Exception as e:
+                    logger.warning(f"RAM write failed: {e}")
+            else:
+                self.read_conn.executemany(sql, seq_of_params)
+                if not self._in_transaction:
+                    self.read_conn.commit()
+
     def _begin_transaction(self):
         """Begin transaction on both disk and RAM connections."""
         if self.disk_conn:
@@ -488,6 +531,36 @@ class HebbianMindDatabase:
         cursor.execute("SELECT * FROM nodes ORDER BY category, name LIMIT ?", (limit,))
         return [dict(row) for row in cursor.fetchall()]
 
+    def _get_node_vocab(self, limit: int = 10000) -> List[tuple]:
+        """Get (node, keyword_terms, phrase_terms) for every node, decoded once.
+
+        Node vocabularies only change when nodes are inserted, so the parsed
+        terms are kept, keyed by limit, until _insert_node invalidates them.
+        Only this instance's _insert_node does so: nodes written to the same
+        disk DB by another process are not seen until the server restarts.
+        """
+        cached = self._node_vocab
+        if cached is not None and cached[0] == limit:
+            return cached[1]
+        cursor = self.read_conn.cursor()
+        cursor.execute(
+            """
+            SELECT id, node_id, name, category, keywords, prototype_phrases
+            FROM nodes ORDER BY category, name LIMIT ?
+        """,
+            (limit,),
+        )
+        vocab = [
+            (
+                dict(row),
+                _parse_terms(row["keywords"] or "[]"),
+                _parse_terms(row["prototype_phrases"] or "[]"),
+            )
+            for row in cursor.fetchall()
+        ]
+        self._node_vocab = (limit, vocab)
+        return vocab
+
     def get_node_by_name(self, name: str) -> Optional[Dict]:
         """Get a node by name or node_id."""
         cursor = self.read_conn.cursor()
@@ -512,7 +585,6 @@ class HebbianMindDatabase:
         if threshold is None:
             threshold = Config.ACTIVATION_THRESHOLD
 
-        nodes = self.get_all_nodes()
         activations = []
         content_lower = content.lower()
 
@@ -527,23 +599,15 @@ class HebbianMindDatabase:
             except Exception as e:
                 print(f"[HEBBIAN-MIND] PRECOG extraction error: {e}", file=sys.stderr)
 
-        for node in nodes:
-            raw_keywords = node.get("keywords", [])
-            keywords = json.loads(raw_keywords) if isinstance(raw_keywords, str) else raw_keywords
-            raw_phrases = node.get("prototype_phrases", [])
-            prototype_phrases = (
-                json.loads(raw_phrases) if isinstance(raw_phrases, str) else raw_phrases
-            )
-
+        for node, keywords, prototype_phrases in self._get_node_vocab():
             score = 0.0
             matched_keywords = []
             precog_boosted = False
 
             # Check keywords
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
+            for keyword, keyword_lower in keywords:
                 if keyword_lower in content_lower:
-                    if re.search(r"\b" + re.escape(keyword_lower) + r"\b", content_lower):
+                    if _keyword_pattern(keyword_lower).search(content_lower):
                         score += 0.25
                         matched_keywords.append(keyword)
                     else:
@@ -557,15 +621,15 @@ class HebbianMindDatabase:
                         matched_keywords.append(f"[precog]{keyword}")
 
             # Check prototype phrases (higher weight)
-            for phrase in prototype_phrases:
-                if phrase.lower() in content_lower:
+            for phrase, phrase_lower in prototype_phrases:
+                if phrase_lower in content_lower:
                     score += 0.35
                     matched_keywords.append(f"[phrase]{phrase}")
 
             # Additional PRECOG boost: Check if node name matches PRECOG concepts
-            node_name_lower = node["name"].lower().replace(" ", "_")
-            node_name_nospace = node_name_lower.replace("_", "")
             if precog_concepts_lower:
+                node_name_lower = node["name"].lower().replace(" ", "_")
+                node_name_nospace = node_name_lower.replace("_", "")
                 if (
                     node_name_lower in precog_concepts_lower
                     or node_name_nospace in precog_concepts_lower
@@ -645,30 +709,26 @@ class HebbianMindDatabase:
                 )
 
                 # Record activations and update node counts
-                for activation in activations:
-                    self._dual_write(
-                        """
-                        INSERT INTO memory_activations (memory_id, node_id, activation_score)
-                        VALUES (?, ?, ?)
-                    """,
-                        (memory_id, activation["node_id"], activation["score"]),
-                    )
+                self._dual_write_many(
+                    """
+                    INSERT INTO memory_activations (memory_id, node_id, activation_score)
+                    VALUES (?, ?, ?)
+                """,
+                    [(memory_id, a["node_id"], a["score"]) for a in activations],
+                )
 
-                    self._dual_write(
-                        """
-                        UPDATE nodes SET
-                            activation_count = activation_count + 1,
-                            last_activated = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """,
-                        (activation["node_id"],),
-                    )
+                self._dual_write_many(
+                    """
+                    UPDATE nodes SET
+                        activation_count = activation_count + 1,
+                        last_activated = ?
+                    WHERE id = ?
+                """,
+                    [(now, a["node_id"]) for a in activations],
+                )
 
                 # Hebbian learning: strengthen edges between co-activated nodes
-                node_ids = [a["node_id"] for a in activations]
-                for i, source_id in enumerate(node_ids):
-                    for target_id in node_ids[i + 1 :]:
-                        self._strengthen_edge(source_id, target_id)
+                self._strengthen_edges([a["node_id"] for a in activations])
 
                 # Homeostatic maintenance every N co-activations
                 self._coactivation_count += 1
@@ -684,44 +744,42 @@ class HebbianMindDatabase:
                 self._rollback_transaction()
                 raise RuntimeError(f"save_memory failed for memory_id={memory_id}: {e}") from e
 
-    def _strengthen_edge(self, source_id: int, target_id: int):
-        """Strengthen edge using asymptotic formula (anti-saturation)."""
-        id1, id2 = min(source_id, target_id), max(source_id, target_id)
-
-        cursor = self.read_conn.cursor()
-        cursor.execute("SELECT weight FROM edges WHERE source_id = ? AND target_id = ?", (id1, id2))
-        row = cursor.fetchone()
+    def _strengthen_edges(self, node_ids: List[int]):
+        """Strengthen every edge in a co-activation clique using the asymptotic formula.
 
+        All pairs go through one executemany upsert; the weight update is
+        evaluated in SQL so no per-pair SELECT round-trip is needed.
+        """
         now = time.time()
+        pairs = [
+            {
+                "id1": min(source_id, target_id),
+                "id2": max(source_id, target_id),
+                "now": now,
+                "min_w": MIN_WEIGHT,
+                "max_w": MAX_WEIGHT,
+                "rate": LEARNING_RATE,
+            }
+            for i, source_id in enumerate(node_ids)
+            for target_id in node_ids[i + 1 :]
+        ]
+        if not pairs:
+            return
 
-        if not row:
-            self._dual_write(
-                """
-                INSERT INTO edges (source_id, target_id, weight, co_activation_count, last_strengthened, last_coactivated)
-                VALUES (?, ?, 0.15, 1, ?, ?)
-            """,
-                (id1, id2, now, now),
-            )
-        else:
-            current = row["weight"]
-
-            # Asymptotic formula: delta approaches 0 as weight approaches MAX
-            delta = (MAX_WEIGHT - current) * LEARNING_RATE
-
-            # Clamp to [MIN_WEIGHT, MAX_WEIGHT]
-            new_weight = max(MIN_WEIGHT, min(MAX_WEIGHT, current + delta))
-
-            self._dual_write(
-                """
-                UPDATE edges SET
-                    weight = ?,
-                    co_activation_count = co_activation_count + 1,
-                    last_strengthened = ?,
-                    last_coactivated = ?
-                WHERE source_id = ? AND target_id = ?
-            """,
-                (new_weight, now, now, id1, id2),
-            )
+        # New edges start at 0.15; existing edges move toward MAX_WEIGHT by
+        # delta = (MAX - w) * rate, clamped to [MIN_WEIGHT, MAX_WEIGHT]
+        self._dual_write_many(
+            """
+            INSERT INTO edges (source_id, target_id, weight, co_activation_count, last_strengthened, last_coactivated)
+            VALUES (:id1, :id2, 0.15, 1, :now, :now)
+            ON CONFLICT(source_id, target_id) DO UPDATE SET
+                weight = MAX(:min_w, MIN(:max_w, weight + (:max_w - weight) * :rate)),
+                co_activation_count = co_activation_count + 1,
+                last_strengthened = excluded.last_strengthened,
+                last_coactivated = excluded.last_coactivated
+        """,
+            pairs,
+        )
 
     def _apply_time_decay(self):
         """Apply time-based decay to idle edges."""
@@ -804,11 +862,20 @@ class HebbianMindDatabase:
         with self._lock:
             cursor = self.read_conn.cursor()
 
-            node_ids = []
-            for name in node_names:
-                node = self.get_node_by_name(name)
-                if node:
-                    node_ids.append(node["id"])
+            if not node_names:
+                return []
+
+            # Resolve every name in one statement (same match rules as get_node_by_name)
+            name_placeholders = ",".join("?" * len(node_names))
+            lower_placeholders = ",".join("LOWER(?)" for _ in node_names)
+            cursor.execute(
+                f"""
+                SELECT id FROM nodes
+                WHERE node_id IN ({name_placeholders}) OR LOWER(name) IN ({lower_placeholders})
+            """,
+                (*node_names, *node_names),
+            )
+            node_ids = [row["id"] for row in cursor.fetchall()]
 
             if not node_ids:
                 return []
@@ -827,7 +894,7 @@ class HebbianMindDatabase:
 
             cursor.execute(
                 f"""
-                SELECT DISTINCT m.*,
+                SELECT m.*,
                        GROUP_CONCAT(n.name || ':' || ma.activation_score) as activations
                 FROM memories m
                 JOIN memory_activations ma ON m.memory_id = ma.memory_id
@@ -1174,7 +1241,7 @@ async def call_tool(name: str, arguments: Dict) -> List[types.TextContent]:
                     )
                 ]
 
-            memory_id = f"hebbian_mind_{uuid.uuid4().hex[:16]}"
+            memory_id = _new_memory_id()
 
             if not summary:
                 top_nodes = [a["name"] for a in activations[:5]]
@@ -4,16 +4,27 @@ Pytest configuration and fixtures for Hebbian Mind Enterprise tests
 Copyright (c) 2026 CIPS LLC
 """
 
+import ast
 import json
 import os
 import sqlite3
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+SRC_DIR = Path(__file__).parent.parent / "src" / "hebbian_mind"
+
+
+def _load_source(name: str) -> SimpleNamespace:
+    """Read and parse a hebbian_mind module file once."""
+    path = SRC_DIR / name
+    text = path.read_text(encoding="utf-8")
+    return SimpleNamespace(path=path, text=text, tree=ast.parse(text))
+
 
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
@@ -64,7 +75,7 @@ def mock_config(test_config: Dict):
         yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_nodes() -> list:
     """Provide sample test nodes."""
     return [
@@ -111,6 +122,18 @@ def nodes_file(test_config: Dict, sample_nodes: list) -> Path:
     return nodes_path
 
 
+@pytest.fixture(scope="session")
+def nodes_data(tmp_path_factory, sample_nodes: list) -> list:
+    """Provide the node list of a nodes_v2.json file, written and parsed once per session."""
+    nodes_path = tmp_path_factory.mktemp("nodes") / "nodes_v2.json"
+    nodes_path.write_text(json.dumps({"nodes": sample_nodes}, indent=2), encoding="utf-8")
+
+    with open(nodes_path, "rb") as f:
+        data = json.load(f)
+
+    return data.get("nodes", data)
+
+
 @pytest.fixture
 def test_db(test_config: Dict) -> Generator[sqlite3.Connection, None, None]:
     """Provide a test database connection."""
@@ -121,6 +144,14 @@ def test_db(test_config: Dict) -> Generator[sqlite3.Connection, None, None]:
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
 
+    # Tests commit often; WAL + synchronous=NORMAL keeps commits off the fsync path
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    # Serve read-back assertions from a mapped window and a 64 MiB page cache
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+
     # Create schema
     conn.executescript("""
         CREATE TABLE IF NOT EXISTS nodes (
@@ -145,7 +176,8 @@ def test_db(test_config: Dict) -> Generator[sqlite3.Connection, None, None]:
             last_strengthened TIMESTAMP,
             FOREIGN KEY (source_id) REFERENCES nodes(id),
             FOREIGN KEY (target_id) REFERENCES nodes(id),
-            UNIQUE(source_id, target_id)
+            UNIQUE(source_id, target_id),
+            CHECK(source_id < target_id)
         );
 
         CREATE TABLE IF NOT EXISTS memories (
@@ -172,6 +204,10 @@ def test_db(test_config: Dict) -> Generator[sqlite3.Connection, None, None]:
         CREATE INDEX IF NOT EXISTS idx_nodes_category ON nodes(category);
         CREATE INDEX IF NOT EXISTS idx_edges_weight ON edges(weight);
         CREATE INDEX IF NOT EXISTS idx_memories_source ON memories(source);
+        CREATE INDEX IF NOT EXISTS idx_edges_target_id ON edges(target_id);
+        CREATE INDEX IF NOT EXISTS idx_memact_memory_id ON memory_activations(memory_id);
+        CREATE INDEX IF NOT EXISTS idx_memact_node_id ON memory_activations(node_id);
+        CREATE INDEX IF NOT EXISTS idx_nodes_activation_count ON nodes(activation_count);
     """)
     conn.commit()
 
@@ -183,24 +219,26 @@ def test_db(test_config: Dict) -> Generator[sqlite3.Connection, None, None]:
 @pytest.fixture
 def populated_db(test_db: sqlite3.Connection, sample_nodes: list) -> sqlite3.Connection:
     """Provide a database populated with test nodes."""
-    for node in sample_nodes:
-        test_db.execute(
+    with test_db:
+        test_db.executemany(
             """
             INSERT INTO nodes (node_id, name, category, keywords, prototype_phrases, description, weight)
             VALUES (?, ?, ?, ?, ?, ?, ?)
         """,
-            (
-                node["id"],
-                node["name"],
-                node["category"],
-                json.dumps(node["keywords"]),
-                json.dumps(node["prototype_phrases"]),
-                node["description"],
-                node["weight"],
-            ),
+            [
+                (
+                    node["id"],
+                    node["name"],
+                    node["category"],
+                    json.dumps(node["keywords"]),
+                    json.dumps(node["prototype_phrases"]),
+                    node["description"],
+                    node["weight"],
+                )
+                for node in sample_nodes
+            ],
         )
 
-    test_db.commit()
     return test_db
 
 
@@ -237,6 +275,18 @@ def mock_precog():
     return mock
 
 
+@pytest.fixture(scope="session")
+def server_src() -> SimpleNamespace:
+    """server.py as path, text and parsed AST, shared across the session."""
+    return _load_source("server.py")
+
+
+@pytest.fixture(scope="session")
+def decay_src() -> SimpleNamespace:
+    """decay.py as path, text and parsed AST, shared across the session."""
+    return _load_source("decay.py")
+
+
 @pytest.fixture(autouse=True)
 def reset_environment():
     """Reset environment variables before each test."""
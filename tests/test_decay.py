@@ -1189,6 +1189,15 @@ class TestConfigIntegration:
         assert summary["decay"]["enabled"] is True
         assert summary["decay"]["base_rate"] == 0.01
 
+    def test_get_decay_config_returns_independent_copies(self):
+        """Memoized decay config should not leak mutations between callers."""
+        from hebbian_mind.config import Config
+
+        first = Config.get_decay_config()
+        first["base_rate"] = 99.0
+
+        assert Config.get_decay_config()["base_rate"] == Config.DECAY_BASE_RATE
+
     def test_config_env_override(self):
         """Decay config should respect environment variables."""
         import os
@@ -69,6 +69,12 @@ class TestErrorSanitization:
         result = sanitize_error_message(error)
         assert result == str(error)
 
+    def test_clean_message_returned_without_copy(self):
+        """Test that a message with nothing to scrub is returned as the same object."""
+        message = "Invalid argument: limit must be a number"
+        result = sanitize_error_message(Exception(message))
+        assert result is message
+
     def test_handles_empty_error(self):
         """Test that empty errors are handled."""
         error = Exception("")
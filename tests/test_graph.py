@@ -141,7 +141,8 @@ class TestEdgeOperations:
 
         # Verify edge exists
         cursor.execute(
-            "SELECT * FROM edges WHERE source_id = ? AND target_id = ?", (node1_id, node2_id)
+            "SELECT weight, co_activation_count FROM edges WHERE source_id = ? AND target_id = ?",
+            (node1_id, node2_id),
         )
         edge = cursor.fetchone()
 
@@ -174,7 +175,7 @@ class TestEdgeOperations:
         # Should find edge regardless of query order
         cursor.execute(
             """
-            SELECT * FROM edges
+            SELECT id FROM edges
             WHERE (source_id = ? AND target_id = ?)
                OR (source_id = ? AND target_id = ?)
         """,
@@ -213,6 +214,25 @@ class TestEdgeOperations:
                 (node1_id, node2_id, 0.7),
             )
 
+    def test_edge_ordering_check_constraint(self, populated_db: sqlite3.Connection):
+        """Test that reversed (source > target) and self edges are rejected."""
+        cursor = populated_db.cursor()
+
+        cursor.execute("SELECT id FROM nodes WHERE node_id = ?", ("node_1",))
+        node1_id = cursor.fetchone()["id"]
+        cursor.execute("SELECT id FROM nodes WHERE node_id = ?", ("node_2",))
+        node2_id = cursor.fetchone()["id"]
+
+        for source_id, target_id in [
+            (max(node1_id, node2_id), min(node1_id, node2_id)),
+            (node1_id, node1_id),
+        ]:
+            with pytest.raises(sqlite3.IntegrityError):
+                populated_db.execute(
+                    "INSERT INTO edges (source_id, target_id, weight) VALUES (?, ?, ?)",
+                    (source_id, target_id, 0.5),
+                )
+
     def test_get_edges_by_weight(self, populated_db: sqlite3.Connection):
         """Test retrieving edges with minimum weight threshold."""
         cursor = populated_db.cursor()
@@ -236,7 +256,7 @@ class TestEdgeOperations:
         populated_db.commit()
 
         # Query edges with min weight 0.3
-        cursor.execute("SELECT * FROM edges WHERE weight >= ?", (0.3,))
+        cursor.execute("SELECT weight FROM edges WHERE weight >= ?", (0.3,))
         edges = cursor.fetchall()
 
         assert len(edges) == 1
@@ -263,7 +283,7 @@ class TestEdgeOperations:
         # Find nodes related to node_1
         cursor.execute(
             """
-            SELECT n.*, e.weight
+            SELECT n.node_id, e.weight
             FROM edges e
             JOIN nodes n ON (e.target_id = n.id OR e.source_id = n.id)
             WHERE (e.source_id = ? OR e.target_id = ?)
@@ -299,7 +319,7 @@ class TestEdgeOperations:
         populated_db.commit()
 
         # Get strongest edges
-        cursor.execute("SELECT * FROM edges ORDER BY weight DESC LIMIT 1")
+        cursor.execute("SELECT weight FROM edges ORDER BY weight DESC LIMIT 1")
         strongest = cursor.fetchone()
 
         assert strongest["weight"] == 0.8
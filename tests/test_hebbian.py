@@ -7,34 +7,42 @@ Copyright (c) 2026 CIPS LLC
 """
 
 import json
+import re
 import sqlite3
 
 import pytest
 
 
+def _has_index(conn: sqlite3.Connection, table: str, name: str) -> bool:
+    """Return True if the schema defines index `name` on `table`."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND name = ?",
+        (table, name),
+    ).fetchone()
+    return row is not None
+
+
 class TestNodeActivation:
     """Test node activation and keyword matching."""
 
     def test_keyword_exact_match(self, populated_db: sqlite3.Connection):
         """Test exact keyword match in content."""
-        cursor = populated_db.cursor()
-        content = "This is a test of the system"
-
-        # Get node with 'test' keyword
-        cursor.execute("SELECT * FROM nodes WHERE node_id = ?", ("node_1",))
-        node = cursor.fetchone()
-        keywords = json.loads(node["keywords"])
-
-        # Check if any keyword matches
-        content_lower = content.lower()
-        matches = [kw for kw in keywords if kw.lower() in content_lower]
+        content_lower = "This is a test of the system".lower()
+        row = populated_db.execute(
+            "SELECT keywords FROM nodes WHERE node_id = ?", ("node_1",)
+        ).fetchone()
+
+        # Full keyword hits use the same word-boundary rule as analyze_content
+        matches = [
+            kw
+            for kw in json.loads(row["keywords"])
+            if re.search(r"\b" + re.escape(kw.lower()) + r"\b", content_lower)
+        ]
 
         assert "test" in matches
 
     def test_keyword_word_boundary_match(self, populated_db: sqlite3.Connection):
         """Test word boundary matching for keywords."""
-        import re
-
         content = "testing is important"  # Contains 'test' but not as word boundary
 
         keyword = "test"
@@ -44,21 +52,22 @@ class TestNodeActivation:
         assert keyword in content_lower
 
         # Word boundary match (should NOT match 'test' in 'testing')
-        word_boundary_match = bool(re.search(r"\b" + re.escape(keyword) + r"\b", content_lower))
-        assert not word_boundary_match
+        word_boundary = re.compile(r"\b" + re.escape(keyword) + r"\b")
+        assert word_boundary.search(content_lower) is None
+        assert word_boundary.search("a test run") is not None
 
     def test_prototype_phrase_matching(self, populated_db: sqlite3.Connection):
         """Test prototype phrase matching in content."""
-        cursor = populated_db.cursor()
-        content = "This is a test of the prototype system"
-
-        cursor.execute("SELECT * FROM nodes WHERE node_id = ?", ("node_1",))
-        node = cursor.fetchone()
-        phrases = json.loads(node["prototype_phrases"])
-
-        # Check if any phrase matches
-        content_lower = content.lower()
-        matches = [phrase for phrase in phrases if phrase.lower() in content_lower]
+        content_lower = "This is a test of the prototype system".lower()
+        row = populated_db.execute(
+            "SELECT prototype_phrases FROM nodes WHERE node_id = ?", ("node_1",)
+        ).fetchone()
+
+        matches = [
+            phrase
+            for phrase in json.loads(row["prototype_phrases"])
+            if phrase.lower() in content_lower
+        ]
 
         assert "this is a test" in matches
 
@@ -156,6 +165,8 @@ class TestNodeActivation:
 
         assert most_active["activation_count"] == 20  # Last node: 2 * 10
 
+        # Top-K is backed by the activation_count index
+        assert _has_index(populated_db, "nodes", "idx_nodes_activation_count")
 
 class TestHebbianStrengthening:
     """Test Hebbian edge strengthening through co-activation."""
@@ -164,10 +175,11 @@ class TestHebbianStrengthening:
         """Test creating edge when nodes co-activate for first time."""
         cursor = populated_db.cursor()
 
-        cursor.execute("SELECT id FROM nodes WHERE node_id = ?", ("node_1",))
-        node1_id = cursor.fetchone()["id"]
-        cursor.execute("SELECT id FROM nodes WHERE node_id = ?", ("node_2",))
-        node2_id = cursor.fetchone()["id"]
+        cursor.execute(
+            "SELECT id, node_id FROM nodes WHERE node_id IN (?, ?)", ("node_1", "node_2")
+        )
+        ids = {row["node_id"]: row["id"] for row in cursor.fetchall()}
+        node1_id, node2_id = ids["node_1"], ids["node_2"]
 
         # Ensure consistent ordering
         source_id = min(node1_id, node2_id)
@@ -175,7 +187,7 @@ class TestHebbianStrengthening:
 
         # Check no edge exists
         cursor.execute(
-            "SELECT * FROM edges WHERE source_id = ? AND target_id = ?", (source_id, target_id)
+            "SELECT 1 FROM edges WHERE source_id = ? AND target_id = ?", (source_id, target_id)
         )
         assert cursor.fetchone() is None
 
@@ -191,7 +203,8 @@ class TestHebbianStrengthening:
 
         # Verify edge created
         cursor.execute(
-            "SELECT * FROM edges WHERE source_id = ? AND target_id = ?", (source_id, target_id)
+            "SELECT weight, co_activation_count FROM edges WHERE source_id = ? AND target_id = ?",
+            (source_id, target_id),
         )
         edge = cursor.fetchone()
 
@@ -232,34 +245,22 @@ class TestHebbianStrengthening:
         )
         populated_db.commit()
 
-        # Strengthen edge
-        cursor.execute(
-            "SELECT weight FROM edges WHERE source_id = ? AND target_id = ?", (source_id, target_id)
-        )
-        current = cursor.fetchone()["weight"]
-
-        strengthening = 1 / (1 + current)
-        new_weight = min(current + strengthening, 10.0)
-
-        populated_db.execute(
+        # Strengthen edge and read the new weight back in the same statement
+        (row,) = populated_db.execute(
             """
             UPDATE edges SET
-                weight = ?,
+                weight = MIN(weight + 1.0 / (1.0 + weight), 10.0),
                 co_activation_count = co_activation_count + 1,
                 last_strengthened = CURRENT_TIMESTAMP
             WHERE source_id = ? AND target_id = ?
+            RETURNING weight
         """,
-            (new_weight, source_id, target_id),
-        )
+            (source_id, target_id),
+        ).fetchall()
         populated_db.commit()
 
         # Verify weight is capped at 10.0
-        cursor.execute(
-            "SELECT weight FROM edges WHERE source_id = ? AND target_id = ?", (source_id, target_id)
-        )
-        final_weight = cursor.fetchone()["weight"]
-
-        assert final_weight <= 10.0
+        assert row["weight"] <= 10.0
 
     def test_co_activation_count_increment(self, populated_db: sqlite3.Connection):
         """Test incrementing co-activation count on strengthening."""
@@ -280,36 +281,22 @@ class TestHebbianStrengthening:
         populated_db.commit()
 
         # Strengthen (simulate co-activation)
-        cursor.execute(
-            "SELECT weight, co_activation_count FROM edges WHERE source_id = ? AND target_id = ?",
-            (source_id, target_id),
-        )
-        edge = cursor.fetchone()
-        current_weight = edge["weight"]
-        current_count = edge["co_activation_count"]
-
-        new_weight = current_weight + (1 / (1 + current_weight))
-
-        populated_db.execute(
+        (row,) = populated_db.execute(
             """
             UPDATE edges SET
-                weight = ?,
+                weight = weight + 1.0 / (1.0 + weight),
                 co_activation_count = co_activation_count + 1,
                 last_strengthened = CURRENT_TIMESTAMP
             WHERE source_id = ? AND target_id = ?
+            RETURNING weight, co_activation_count
         """,
-            (new_weight, source_id, target_id),
-        )
+            (source_id, target_id),
+        ).fetchall()
         populated_db.commit()
 
         # Verify count incremented
-        cursor.execute(
-            "SELECT co_activation_count FROM edges WHERE source_id = ? AND target_id = ?",
-            (source_id, target_id),
-        )
-        new_count = cursor.fetchone()["co_activation_count"]
-
-        assert new_count == current_count + 1
+        assert row["co_activation_count"] == 2
+        assert row["weight"] == pytest.approx(0.5 + 1 / 1.5)
 
     def test_pairwise_strengthening(self, populated_db: sqlite3.Connection):
         """Test strengthening all edges between a set of co-activated nodes."""
@@ -320,26 +307,24 @@ class TestHebbianStrengthening:
 
         # Simulate 3 nodes activating together - should create 3 edges
         # (1,2), (1,3), (2,3)
-        pairs = []
-        for i, id1 in enumerate(node_ids):
-            for id2 in node_ids[i + 1 :]:
-                source_id = min(id1, id2)
-                target_id = max(id1, id2)
-                pairs.append((source_id, target_id))
-
-                # Create or strengthen edge
-                populated_db.execute(
-                    """
-                    INSERT INTO edges (source_id, target_id, weight, co_activation_count)
-                    VALUES (?, ?, ?, ?)
-                    ON CONFLICT(source_id, target_id) DO UPDATE SET
-                        weight = weight + (1.0 / (1.0 + weight)),
-                        co_activation_count = co_activation_count + 1
-                """,
-                    (source_id, target_id, 0.15, 1),
-                )
+        pairs = [
+            (min(id1, id2), max(id1, id2), 0.15, 1)
+            for i, id1 in enumerate(node_ids)
+            for id2 in node_ids[i + 1 :]
+        ]
 
-        populated_db.commit()
+        # Create or strengthen every edge in one statement and one transaction
+        with populated_db:
+            populated_db.executemany(
+                """
+                INSERT INTO edges (source_id, target_id, weight, co_activation_count)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(source_id, target_id) DO UPDATE SET
+                    weight = weight + (1.0 / (1.0 + weight)),
+                    co_activation_count = co_activation_count + 1
+            """,
+                pairs,
+            )
 
         # Verify all pairs have edges
         cursor.execute("SELECT COUNT(*) FROM edges")
@@ -382,6 +367,9 @@ class TestHebbianStrengthening:
 
         assert strongest["weight"] == 0.9
 
+        # Strongest-edge ordering is backed by the weight index
+        assert _has_index(populated_db, "edges", "idx_edges_weight")
+
     def test_timestamp_update_on_strengthening(self, populated_db: sqlite3.Connection):
         """Test that last_strengthened timestamp updates."""
         cursor = populated_db.cursor()
@@ -401,25 +389,20 @@ class TestHebbianStrengthening:
         populated_db.commit()
 
         # Strengthen edge
-        populated_db.execute(
+        (row,) = populated_db.execute(
             """
             UPDATE edges SET
                 weight = weight + 0.1,
                 last_strengthened = CURRENT_TIMESTAMP
             WHERE source_id = ? AND target_id = ?
+            RETURNING last_strengthened
         """,
             (source_id, target_id),
-        )
+        ).fetchall()
         populated_db.commit()
 
         # Verify timestamp updated
-        cursor.execute(
-            "SELECT last_strengthened FROM edges WHERE source_id = ? AND target_id = ?",
-            (source_id, target_id),
-        )
-        timestamp = cursor.fetchone()["last_strengthened"]
-
-        assert timestamp != "2020-01-01 00:00:00"
+        assert row["last_strengthened"] != "2020-01-01 00:00:00"
 
 
 class TestMemoryActivations:
@@ -456,7 +439,7 @@ class TestMemoryActivations:
         # Verify activation recorded
         cursor.execute(
             """
-            SELECT * FROM memory_activations
+            SELECT activation_score FROM memory_activations
             WHERE memory_id = ? AND node_id = ?
         """,
             (memory_id, node_id),
@@ -470,36 +453,31 @@ class TestMemoryActivations:
         """Test querying memories that activated a specific node."""
         cursor = populated_db.cursor()
 
-        # Create memories
+        cursor.execute("SELECT id FROM nodes WHERE node_id = ?", ("node_1",))
+        node_id = cursor.fetchone()["id"]
+
+        # Create memories and record activations in one transaction
         memory_ids = ["mem_001", "mem_002"]
-        for mem_id in memory_ids:
-            populated_db.execute(
+        with populated_db:
+            populated_db.executemany(
                 """
                 INSERT INTO memories (memory_id, content, summary)
                 VALUES (?, ?, ?)
             """,
-                (mem_id, f"Content {mem_id}", f"Summary {mem_id}"),
+                [(mem_id, f"Content {mem_id}", f"Summary {mem_id}") for mem_id in memory_ids],
             )
-
-        cursor.execute("SELECT id FROM nodes WHERE node_id = ?", ("node_1",))
-        node_id = cursor.fetchone()["id"]
-
-        # Record activations
-        for mem_id in memory_ids:
-            populated_db.execute(
+            populated_db.executemany(
                 """
                 INSERT INTO memory_activations (memory_id, node_id, activation_score)
                 VALUES (?, ?, ?)
             """,
-                (mem_id, node_id, 0.5),
+                [(mem_id, node_id, 0.5) for mem_id in memory_ids],
             )
 
-        populated_db.commit()
-
         # Query memories by node
         cursor.execute(
             """
-            SELECT DISTINCT m.*
+            SELECT DISTINCT m.memory_id
             FROM memories m
             JOIN memory_activations ma ON m.memory_id = ma.memory_id
             WHERE ma.node_id = ?
@@ -510,6 +488,9 @@ class TestMemoryActivations:
         memories = cursor.fetchall()
         assert len(memories) == 2
 
+        # The node filter is backed by the memory_activations node index
+        assert _has_index(populated_db, "memory_activations", "idx_memact_node_id")
+
     def test_activation_score_aggregation(self, populated_db: sqlite3.Connection):
         """Test aggregating activation scores for memories."""
         cursor = populated_db.cursor()
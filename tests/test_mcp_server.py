@@ -4,75 +4,115 @@ Tests for MCP server protocol implementation
 Copyright (c) 2026 CIPS LLC
 """
 
+import asyncio
 import json
+from types import MappingProxyType
 
 import pytest
 
+# Serialized once at import; the protocol tests only inspect the text payloads
+_OK_TEXT = json.dumps({"success": True, "message": "Operation completed"})
+_ERR_PAYLOAD = {"success": False, "error": "Test error message"}
+_ERR_TEXT = json.dumps(_ERR_PAYLOAD)
 
-class TestMCPProtocol:
-    """Test MCP protocol compliance."""
-
-    @pytest.mark.asyncio
-    async def test_list_tools_structure(self):
-        """Test that list_tools returns valid MCP tool schema."""
-        # Mock the server's list_tools response
-        mock_tools = [
-            {
-                "name": "save_to_mind",
-                "description": "Save content to Hebbian Mind",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {"content": {"type": "string", "description": "Content to save"}},
-                    "required": ["content"],
-                },
-            }
-        ]
-
-        # Verify structure
-        assert isinstance(mock_tools, list)
-        for tool in mock_tools:
-            assert "name" in tool
-            assert "description" in tool
-            assert "inputSchema" in tool
-            assert tool["inputSchema"]["type"] == "object"
-
-    @pytest.mark.asyncio
-    async def test_call_tool_response_structure(self):
-        """Test that call_tool returns valid MCP response."""
-        mock_response = [
+# Read-only mock payloads shared by the structure tests
+_MOCK_TOOLS = (
+    MappingProxyType(
+        {
+            "name": "save_to_mind",
+            "description": "Save content to Hebbian Mind",
+            "inputSchema": {
+                "type": "object",
+                "properties": {"content": {"type": "string", "description": "Content to save"}},
+                "required": ["content"],
+            },
+        }
+    ),
+)
+# (tool result, expected success flag, key the result must carry)
+_RESULT_SHAPES = (
+    pytest.param(
+        MappingProxyType(
+            {"success": True, "memory_id": "test_001", "activations": [], "edges_strengthened": 0}
+        ),
+        True,
+        "memory_id",
+        id="save_minimal_args",
+    ),
+    pytest.param(
+        MappingProxyType(
             {
-                "type": "text",
-                "text": json.dumps({"success": True, "message": "Operation completed"}),
+                "success": False,
+                "message": "No concept nodes activated above threshold",
+                "threshold": 0.3,
             }
-        ]
-
-        # Verify structure
-        assert isinstance(mock_response, list)
-        for item in mock_response:
-            assert "type" in item
-            assert item["type"] == "text"
-            assert "text" in item
-
-    @pytest.mark.asyncio
-    async def test_error_handling_structure(self):
-        """Test that errors are returned in valid MCP format."""
-        error_response = [
-            {"type": "text", "text": json.dumps({"success": False, "error": "Test error message"})}
-        ]
-
-        # Verify error structure
-        assert isinstance(error_response, list)
-        content = json.loads(error_response[0]["text"])
-        assert content["success"] is False
-        assert "error" in content
-
-
-class TestSaveToMindTool:
-    """Test the save_to_mind tool."""
-
-    def test_save_tool_schema(self):
-        """Test save_to_mind tool schema."""
-        tool_schema = {
+        ),
+        False,
+        "threshold",
+        id="save_no_activations",
+    ),
+    pytest.param(
+        MappingProxyType({"success": False, "message": "No nodes specified"}),
+        False,
+        "message",
+        id="query_no_nodes",
+    ),
+    pytest.param(
+        MappingProxyType({"success": False, "message": "Node not found: Nonexistent"}),
+        False,
+        "message",
+        id="related_node_not_found",
+    ),
+)
+# save_to_mind response for a call with every argument set
+_SAVE_FULL_RESULT = MappingProxyType(
+    {
+        "success": True,
+        "memory_id": "test_002",
+        "activations": [],
+        "edges_strengthened": 0,
+        "summary": "Test summary",
+    }
+)
+# save_to_mind response that activated one node
+_SAVE_ACTIVATIONS_RESULT = MappingProxyType(
+    {
+        "success": True,
+        "memory_id": "test_003",
+        "activations": [
+            {"node": "node_1", "name": "Test Concept", "category": "test", "score": 0.75}
+        ],
+        "edges_strengthened": 0,
+    }
+)
+# status response with statistics and dual-write info
+_STATUS_RESULT = MappingProxyType(
+    {
+        "success": True,
+        "status": "operational",
+        "statistics": {
+            "node_count": 118,
+            "edge_count": 250,
+            "memory_count": 100,
+            "total_activations": 1000,
+        },
+        "dual_write": {
+            "enabled": False,
+            "using_ram": False,
+            "ram_path": None,
+            "disk_path": "/path/to/db",
+        },
+    }
+)
+_STRONGEST_CONNECTIONS = (
+    MappingProxyType({"source": "Node1", "target": "Node2", "weight": 5.5}),
+    MappingProxyType({"source": "Node3", "target": "Node4", "weight": 4.2}),
+)
+
+# (tool schema, required fields, optional field -> expected JSON type)
+_TOOL_SCHEMAS = (
+    (
+        {
             "name": "save_to_mind",
             "description": "Save content to Hebbian Mind with automatic node activation",
             "inputSchema": {
@@ -89,34 +129,167 @@ class TestSaveToMindTool:
                 },
                 "required": ["content"],
             },
-        }
+        },
+        ("content",),
+        {"summary": "string", "importance": "number", "emotional_intensity": "number"},
+    ),
+    (
+        {
+            "name": "query_mind",
+            "description": "Query memories by concept nodes",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "nodes": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "List of node names to query",
+                    },
+                    "limit": {"type": "number", "description": "Max results"},
+                },
+            },
+        },
+        (),
+        {"nodes": "array", "limit": "number"},
+    ),
+    (
+        {
+            "name": "analyze_content",
+            "description": "Analyze content against concept nodes without saving",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "content": {"type": "string", "description": "Content to analyze"},
+                    "threshold": {"type": "number", "description": "Activation threshold 0-1"},
+                },
+                "required": ["content"],
+            },
+        },
+        ("content",),
+        {"threshold": "number"},
+    ),
+    (
+        {
+            "name": "get_related_nodes",
+            "description": "Get nodes connected by Hebbian edges",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "node": {"type": "string", "description": "Node name"},
+                    "min_weight": {"type": "number", "description": "Minimum edge weight"},
+                },
+                "required": ["node"],
+            },
+        },
+        ("node",),
+        {"min_weight": "number"},
+    ),
+)
+
+
+_JSON_TYPES = frozenset({"string", "number", "integer", "boolean", "array", "object"})
+
+
+def _check_input_schema(input_schema: dict) -> None:
+    """Assert an MCP tool inputSchema is a well-formed JSON Schema object."""
+    assert input_schema["type"] == "object"
+    properties = input_schema["properties"]
+    for prop in properties.values():
+        assert prop["type"] in _JSON_TYPES
+        if prop["type"] == "array":
+            assert prop["items"]["type"] in _JSON_TYPES
+    assert set(input_schema.get("required", ())) <= properties.keys()
+
+
+def _check_tool(name, description, input_schema) -> None:
+    """Assert an MCP tool descriptor is named, described and has a valid inputSchema."""
+    assert type(name) is str and name
+    assert type(description) is str and description
+    _check_input_schema(input_schema)
+
+
+class TestToolSchemas:
+    """Test tool input schemas."""
+
+    @pytest.mark.parametrize(
+        "tool_schema,required,optional",
+        _TOOL_SCHEMAS,
+        ids=[schema["name"] for schema, _, _ in _TOOL_SCHEMAS],
+    )
+    def test_tool_schema(self, tool_schema, required, optional):
+        """Test required fields and typed optional properties of each tool schema."""
+        input_schema = tool_schema["inputSchema"]
+        _check_tool(tool_schema["name"], tool_schema["description"], input_schema)
 
         # Verify required fields
-        assert "content" in tool_schema["inputSchema"]["required"]
+        for field in required:
+            assert field in input_schema["required"]
 
         # Verify optional fields
-        properties = tool_schema["inputSchema"]["properties"]
-        assert "summary" in properties
-        assert "importance" in properties
-        assert "emotional_intensity" in properties
+        properties = input_schema["properties"]
+        for field, field_type in optional.items():
+            assert properties[field]["type"] == field_type
 
-    @pytest.mark.asyncio
-    async def test_save_with_minimal_args(self):
-        """Test saving with only required arguments."""
+    def test_server_tool_schemas_well_formed(self):
+        """Test every tool the server advertises has a well-formed input schema."""
+        from hebbian_mind.server import list_tools
 
-        # Simulate tool execution
-        result = {
-            "success": True,
-            "memory_id": "test_001",
-            "activations": [],
-            "edges_strengthened": 0,
-        }
+        tools = asyncio.run(list_tools())
 
-        assert result["success"] is True
-        assert "memory_id" in result
+        assert tools
+        for tool in tools:
+            _check_tool(tool.name, tool.description, tool.inputSchema)
+
+
+class TestMCPProtocol:
+    """Test MCP protocol compliance."""
+
+    def test_list_tools_structure(self):
+        """Test that list_tools returns valid MCP tool schema."""
+        # Mock the server's list_tools response
+        mock_tools = _MOCK_TOOLS
 
-    @pytest.mark.asyncio
-    async def test_save_with_full_args(self):
+        # Verify structure
+        assert type(mock_tools) in (list, tuple)
+        for tool in mock_tools:
+            _check_tool(tool["name"], tool["description"], tool["inputSchema"])
+
+    def test_call_tool_response_structure(self):
+        """Test that call_tool returns valid MCP response."""
+        mock_response = [{"type": "text", "text": _OK_TEXT}]
+
+        # Verify structure
+        assert type(mock_response) is list
+        for item in mock_response:
+            assert "type" in item
+            assert item["type"] == "text"
+            assert "text" in item
+
+    def test_error_handling_structure(self):
+        """Test that errors are returned in valid MCP format."""
+        error_response = [{"type": "text", "text": _ERR_TEXT}]
+
+        # Verify error structure
+        assert type(error_response) is list
+        assert error_response[0]["text"] is _ERR_TEXT
+        assert _ERR_PAYLOAD["success"] is False
+        assert "error" in _ERR_PAYLOAD
+
+
+class TestToolResultShapes:
+    """Test the success flag and key fields of simple tool results."""
+
+    @pytest.mark.parametrize("result,ok,key", _RESULT_SHAPES)
+    def test_result_shape(self, result, ok, key):
+        """Test a tool result carries the expected success flag and key."""
+        assert result["success"] is ok
+        assert key in result
+
+
+class TestSaveToMindTool:
+    """Test the save_to_mind tool."""
+
+    def test_save_with_full_args(self):
         """Test saving with all arguments."""
         args = {
             "content": "Full test content",
@@ -126,123 +299,61 @@ class TestSaveToMindTool:
             "emotional_intensity": 0.6,
         }
 
-        result = {
-            "success": True,
-            "memory_id": "test_002",
-            "activations": [],
-            "edges_strengthened": 0,
-            "summary": args["summary"],
-        }
+        result = _SAVE_FULL_RESULT
 
         assert result["success"] is True
         assert result["summary"] == args["summary"]
 
-    @pytest.mark.asyncio
-    async def test_save_with_no_activations(self):
-        """Test saving content that doesn't activate any nodes."""
-
-        result = {
-            "success": False,
-            "message": "No concept nodes activated above threshold",
-            "threshold": 0.3,
-        }
-
-        assert result["success"] is False
-        assert "threshold" in result
-
-    @pytest.mark.asyncio
-    async def test_save_returns_activations(self):
+    def test_save_returns_activations(self):
         """Test that save returns list of activated nodes."""
-
-        result = {
-            "success": True,
-            "memory_id": "test_003",
-            "activations": [
-                {"node": "node_1", "name": "Test Concept", "category": "test", "score": 0.75}
-            ],
-            "edges_strengthened": 0,
-        }
+        result = _SAVE_ACTIVATIONS_RESULT
 
         assert len(result["activations"]) > 0
         assert "score" in result["activations"][0]
 
 
-class TestQueryMindTool:
-    """Test the query_mind tool."""
+def _query_result(nodes, memories=()):
+    """Build a successful query_mind result for the given nodes and memories."""
+    return {
+        "success": True,
+        "queried_nodes": nodes,
+        "memories_found": len(memories),
+        "memories": list(memories),
+    }
 
-    def test_query_tool_schema(self):
-        """Test query_mind tool schema."""
-        tool_schema = {
-            "name": "query_mind",
-            "description": "Query memories by concept nodes",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "nodes": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of node names to query",
-                    },
-                    "limit": {"type": "number", "description": "Max results"},
-                },
-            },
-        }
 
-        # Verify schema structure
-        assert tool_schema["inputSchema"]["properties"]["nodes"]["type"] == "array"
+class TestQueryMindTool:
+    """Test the query_mind tool."""
 
-    @pytest.mark.asyncio
-    async def test_query_by_single_node(self):
+    def test_query_by_single_node(self):
         """Test querying by single node."""
         args = {"nodes": ["Test Concept"], "limit": 20}
 
-        result = {
-            "success": True,
-            "queried_nodes": args["nodes"],
-            "memories_found": 2,
-            "memories": [
+        result = _query_result(
+            args["nodes"],
+            (
                 {"memory_id": "mem_001", "summary": "Test 1"},
                 {"memory_id": "mem_002", "summary": "Test 2"},
-            ],
-        }
+            ),
+        )
 
         assert result["success"] is True
         assert result["memories_found"] == len(result["memories"])
 
-    @pytest.mark.asyncio
-    async def test_query_by_multiple_nodes(self):
+    def test_query_by_multiple_nodes(self):
         """Test querying by multiple nodes."""
         args = {"nodes": ["Test Concept", "Related Concept"], "limit": 10}
 
-        result = {
-            "success": True,
-            "queried_nodes": args["nodes"],
-            "memories_found": 1,
-            "memories": [{"memory_id": "mem_003", "summary": "Test 3"}],
-        }
+        result = _query_result(args["nodes"], ({"memory_id": "mem_003", "summary": "Test 3"},))
 
         assert len(args["nodes"]) == 2
         assert result["memories_found"] >= 0
 
-    @pytest.mark.asyncio
-    async def test_query_with_no_nodes(self):
-        """Test querying without specifying nodes."""
-
-        result = {"success": False, "message": "No nodes specified"}
-
-        assert result["success"] is False
-
-    @pytest.mark.asyncio
-    async def test_query_nonexistent_node(self):
+    def test_query_nonexistent_node(self):
         """Test querying node that doesn't exist."""
         args = {"nodes": ["Nonexistent Node"]}
 
-        result = {
-            "success": True,
-            "queried_nodes": args["nodes"],
-            "memories_found": 0,
-            "memories": [],
-        }
+        result = _query_result(args["nodes"])
 
         assert result["memories_found"] == 0
 
@@ -250,26 +361,7 @@ class TestQueryMindTool:
 class TestAnalyzeContentTool:
     """Test the analyze_content tool."""
 
-    def test_analyze_tool_schema(self):
-        """Test analyze_content tool schema."""
-        tool_schema = {
-            "name": "analyze_content",
-            "description": "Analyze content against concept nodes without saving",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "Content to analyze"},
-                    "threshold": {"type": "number", "description": "Activation threshold 0-1"},
-                },
-                "required": ["content"],
-            },
-        }
-
-        assert "content" in tool_schema["inputSchema"]["required"]
-        assert "threshold" in tool_schema["inputSchema"]["properties"]
-
-    @pytest.mark.asyncio
-    async def test_analyze_returns_activations(self):
+    def test_analyze_returns_activations(self):
         """Test that analyze returns activated nodes."""
 
         result = {
@@ -290,8 +382,7 @@ class TestAnalyzeContentTool:
         assert "activations" in result
         assert "matched_keywords" in result["activations"][0]
 
-    @pytest.mark.asyncio
-    async def test_analyze_with_custom_threshold(self):
+    def test_analyze_with_custom_threshold(self):
         """Test analyzing with custom threshold."""
         args = {"content": "Test content", "threshold": 0.5}  # Higher threshold
 
@@ -309,25 +400,7 @@ class TestAnalyzeContentTool:
 class TestRelatedNodesTool:
     """Test the get_related_nodes tool."""
 
-    def test_related_nodes_tool_schema(self):
-        """Test get_related_nodes tool schema."""
-        tool_schema = {
-            "name": "get_related_nodes",
-            "description": "Get nodes connected by Hebbian edges",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Node name"},
-                    "min_weight": {"type": "number", "description": "Minimum edge weight"},
-                },
-                "required": ["node"],
-            },
-        }
-
-        assert "node" in tool_schema["inputSchema"]["required"]
-
-    @pytest.mark.asyncio
-    async def test_get_related_nodes_success(self):
+    def test_get_related_nodes_success(self):
         """Test getting related nodes."""
 
         result = {
@@ -343,71 +416,43 @@ class TestRelatedNodesTool:
         assert result["success"] is True
         assert result["related_count"] == len(result["related_nodes"])
 
-    @pytest.mark.asyncio
-    async def test_get_related_nodes_not_found(self):
-        """Test querying related nodes for nonexistent node."""
-
-        result = {"success": False, "message": "Node not found: Nonexistent"}
-
-        assert result["success"] is False
-
 
 class TestStatusTool:
     """Test the status tool."""
 
-    @pytest.mark.asyncio
-    async def test_status_returns_statistics(self):
+    def test_status_returns_statistics(self):
         """Test that status returns system statistics."""
-        result = {
-            "success": True,
-            "status": "operational",
-            "statistics": {
-                "node_count": 118,
-                "edge_count": 250,
-                "memory_count": 100,
-                "total_activations": 1000,
-            },
-            "dual_write": {
-                "enabled": False,
-                "using_ram": False,
-                "ram_path": None,
-                "disk_path": "/path/to/db",
-            },
-        }
+        result = _STATUS_RESULT
 
         assert result["success"] is True
         assert "statistics" in result
         assert "node_count" in result["statistics"]
 
-    @pytest.mark.asyncio
-    async def test_status_includes_strongest_edges(self):
+    def test_status_includes_strongest_edges(self):
         """Test that status includes strongest connections."""
-        result = {
-            "success": True,
-            "strongest_connections": [
-                {"source": "Node1", "target": "Node2", "weight": 5.5},
-                {"source": "Node3", "target": "Node4", "weight": 4.2},
-            ],
-        }
+        result = {"success": True, "strongest_connections": _STRONGEST_CONNECTIONS}
 
         assert "strongest_connections" in result
         assert len(result["strongest_connections"]) > 0
 
 
+# Nodes in the "test" category, shared read-only by the list_nodes tests
+_TEST_CATEGORY_NODES = (
+    MappingProxyType({"node_id": "node_1", "name": "Test Concept"}),
+    MappingProxyType({"node_id": "node_2", "name": "Related Concept"}),
+)
+
+
 class TestListNodesTool:
     """Test the list_nodes tool."""
 
-    @pytest.mark.asyncio
-    async def test_list_all_nodes(self):
+    def test_list_all_nodes(self):
         """Test listing all nodes."""
         result = {
             "success": True,
             "total_nodes": 3,
             "categories": {
-                "test": [
-                    {"node_id": "node_1", "name": "Test Concept"},
-                    {"node_id": "node_2", "name": "Related Concept"},
-                ],
+                "test": list(_TEST_CATEGORY_NODES),
                 "other": [{"node_id": "node_3", "name": "Other Category"}],
             },
         }
@@ -415,19 +460,13 @@ class TestListNodesTool:
         assert result["success"] is True
         assert "categories" in result
 
-    @pytest.mark.asyncio
-    async def test_list_nodes_by_category(self):
+    def test_list_nodes_by_category(self):
         """Test listing nodes filtered by category."""
 
         result = {
             "success": True,
             "total_nodes": 2,
-            "categories": {
-                "test": [
-                    {"node_id": "node_1", "name": "Test Concept"},
-                    {"node_id": "node_2", "name": "Related Concept"},
-                ]
-            },
+            "categories": {"test": list(_TEST_CATEGORY_NODES)},
         }
 
         assert len(result["categories"]) == 1
@@ -438,8 +477,7 @@ class TestListNodesTool:
 class TestMCPServerIntegration:
     """Integration tests for full MCP server functionality."""
 
-    @pytest.mark.asyncio
-    async def test_save_and_query_workflow(self):
+    def test_save_and_query_workflow(self):
         """Test complete workflow: save memory, then query it."""
         # Save memory
         save_result = {
@@ -459,8 +497,7 @@ class TestMCPServerIntegration:
 
         assert query_result["memories_found"] == 1
 
-    @pytest.mark.asyncio
-    async def test_analyze_before_save_workflow(self):
+    def test_analyze_before_save_workflow(self):
         """Test workflow: analyze content, then save if satisfied."""
         # Analyze first
         analyze_result = {
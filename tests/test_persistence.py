@@ -5,12 +5,28 @@ Copyright (c) 2026 CIPS LLC
 """
 
 import json
-import shutil
 import sqlite3
 from pathlib import Path
 
 import pytest
 
+_EMPTY_JSON_ARRAY = "[]"
+_REQUIRED_NODE_FIELDS = frozenset({"name", "category", "keywords", "prototype_phrases"})
+_INSERT_NODE_SQL = """
+    INSERT OR IGNORE INTO nodes (node_id, name, category, keywords, prototype_phrases, description, weight)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _tune(conn: sqlite3.Connection) -> None:
+    """Apply the WAL pragma set the fixture connections use, plus a larger cache."""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA busy_timeout=5000")
+
 
 class TestDiskPersistence:
     """Test disk-only persistence mode."""
@@ -22,6 +38,7 @@ class TestDiskPersistence:
 
         db_path = test_config["disk_db_path"]
         conn = sqlite3.connect(str(db_path))
+        _tune(conn)
 
         # Verify database file exists
         assert db_path.exists()
@@ -59,21 +76,21 @@ class TestDiskPersistence:
 
         # Write data
         conn1 = sqlite3.connect(str(db_path))
-        conn1.execute("CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY, value TEXT)")
-        conn1.execute("INSERT INTO test (value) VALUES (?)", ("persistent_data",))
-        conn1.commit()
+        _tune(conn1)
+        conn1.executescript("""
+            CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY, value TEXT);
+            INSERT INTO test (value) VALUES ('persistent_data');
+            """)
         conn1.close()
 
         # Reopen and read
         conn2 = sqlite3.connect(str(db_path))
-        conn2.row_factory = sqlite3.Row
-        cursor = conn2.cursor()
-        cursor.execute("SELECT value FROM test")
-        row = cursor.fetchone()
+        _tune(conn2)
+        row = conn2.execute("SELECT value FROM test").fetchone()
         conn2.close()
 
         assert row is not None
-        assert row["value"] == "persistent_data"
+        assert row[0] == "persistent_data"
 
 
 class TestRAMDiskSetup:
@@ -106,6 +123,7 @@ class TestRAMDiskSetup:
 
         db_path = test_config["disk_db_path"]
         conn = sqlite3.connect(str(db_path))
+        _tune(conn)
         conn.execute("CREATE TABLE IF NOT EXISTS test (id INTEGER)")
         conn.commit()
         conn.close()
@@ -131,11 +149,13 @@ class TestDualWriteMode:
 
         # Create both connections
         disk_conn = sqlite3.connect(str(disk_db))
+        _tune(disk_conn)
         disk_conn.execute("CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY, value TEXT)")
         disk_conn.commit()
 
         if ram_db:
             ram_conn = sqlite3.connect(str(ram_db))
+            _tune(ram_conn)
             ram_conn.execute("CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY, value TEXT)")
             ram_conn.commit()
             ram_conn.close()
@@ -160,40 +180,29 @@ class TestDualWriteMode:
         disk_db = test_config["disk_db_path"]
         ram_db = test_config["ram_db_path"]
 
-        # Setup schema on both
-        for db_path in [disk_db, ram_db]:
-            conn = sqlite3.connect(str(db_path))
-            conn.execute("CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY, value TEXT)")
-            conn.commit()
-            conn.close()
+        # One connection per tier for schema, write and verify, as the
+        # server holds its read/disk connections for its whole lifetime
+        disk_conn = sqlite3.connect(str(disk_db))
+        _tune(disk_conn)
+        ram_conn = sqlite3.connect(str(ram_db))
+        _tune(ram_conn)
 
-        # Simulate dual write
+        # Simulate dual write (disk first, then RAM)
         data = ("test_value",)
         sql = "INSERT INTO test (value) VALUES (?)"
-
-        disk_conn = sqlite3.connect(str(disk_db))
-        disk_conn.execute(sql, data)
-        disk_conn.commit()
-
-        ram_conn = sqlite3.connect(str(ram_db))
-        ram_conn.execute(sql, data)
-        ram_conn.commit()
+        for conn in (disk_conn, ram_conn):
+            conn.execute("CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY, value TEXT)")
+            conn.execute(sql, data)
+            conn.commit()
 
         # Verify both have data
-        disk_conn.row_factory = sqlite3.Row
-        cursor = disk_conn.cursor()
-        cursor.execute("SELECT value FROM test")
-        disk_row = cursor.fetchone()
+        disk_row = disk_conn.execute("SELECT value FROM test").fetchone()
+        ram_row = ram_conn.execute("SELECT value FROM test").fetchone()
         disk_conn.close()
-
-        ram_conn.row_factory = sqlite3.Row
-        cursor = ram_conn.cursor()
-        cursor.execute("SELECT value FROM test")
-        ram_row = cursor.fetchone()
         ram_conn.close()
 
-        assert disk_row["value"] == "test_value"
-        assert ram_row["value"] == "test_value"
+        assert disk_row[0] == "test_value"
+        assert ram_row[0] == "test_value"
 
     @pytest.mark.requires_ram
     def test_ram_read_priority(self, test_config: dict):
@@ -213,9 +222,11 @@ class TestDualWriteMode:
         # Setup and write to both
         for db_path in [disk_db, ram_db]:
             conn = sqlite3.connect(str(db_path))
-            conn.execute("CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY, value TEXT)")
-            conn.execute("INSERT INTO test (value) VALUES (?)", ("data",))
-            conn.commit()
+            _tune(conn)
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY, value TEXT);
+                INSERT INTO test (value) VALUES ('data');
+                """)
             conn.close()
 
         # Simulate read priority logic
@@ -245,31 +256,34 @@ class TestDiskToRAMSync:
 
         # Create and populate disk DB
         disk_conn = sqlite3.connect(str(disk_db))
-        disk_conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, value TEXT)")
-        disk_conn.execute("INSERT INTO test (value) VALUES (?)", ("original_data",))
-        disk_conn.commit()
+        _tune(disk_conn)
+        disk_conn.executescript("""
+            CREATE TABLE test (id INTEGER PRIMARY KEY, value TEXT);
+            INSERT INTO test (value) VALUES ('original_data');
+            """)
         disk_conn.close()
 
         # Ensure RAM DB doesn't exist
-        if ram_db.exists():
-            ram_db.unlink()
+        ram_db.unlink(missing_ok=True)
 
-        # Simulate startup sync
+        # Simulate startup sync (online backup, as the server does)
         if disk_db.exists() and not ram_db.exists():
-            shutil.copy2(disk_db, ram_db)
+            src = sqlite3.connect(str(disk_db))
+            dst = sqlite3.connect(str(ram_db))
+            src.backup(dst)
+            dst.close()
+            src.close()
 
         # Verify RAM DB was created
         assert ram_db.exists()
 
         # Verify data is present
         ram_conn = sqlite3.connect(str(ram_db))
-        ram_conn.row_factory = sqlite3.Row
-        cursor = ram_conn.cursor()
-        cursor.execute("SELECT value FROM test")
-        row = cursor.fetchone()
+        _tune(ram_conn)
+        row = ram_conn.execute("SELECT value FROM test").fetchone()
         ram_conn.close()
 
-        assert row["value"] == "original_data"
+        assert row[0] == "original_data"
 
     @pytest.mark.requires_ram
     def test_skip_copy_if_ram_exists(self, test_config: dict):
@@ -288,16 +302,20 @@ class TestDiskToRAMSync:
 
         # Create disk DB with old data
         disk_conn = sqlite3.connect(str(disk_db))
-        disk_conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, value TEXT)")
-        disk_conn.execute("INSERT INTO test (value) VALUES (?)", ("old_data",))
-        disk_conn.commit()
+        _tune(disk_conn)
+        disk_conn.executescript("""
+            CREATE TABLE test (id INTEGER PRIMARY KEY, value TEXT);
+            INSERT INTO test (value) VALUES ('old_data');
+            """)
         disk_conn.close()
 
         # Create RAM DB with newer data
         ram_conn = sqlite3.connect(str(ram_db))
-        ram_conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, value TEXT)")
-        ram_conn.execute("INSERT INTO test (value) VALUES (?)", ("newer_data",))
-        ram_conn.commit()
+        _tune(ram_conn)
+        ram_conn.executescript("""
+            CREATE TABLE test (id INTEGER PRIMARY KEY, value TEXT);
+            INSERT INTO test (value) VALUES ('newer_data');
+            """)
         ram_conn.close()
 
         # Simulate startup check - should NOT copy if RAM exists
@@ -307,46 +325,42 @@ class TestDiskToRAMSync:
 
         # Verify RAM data is unchanged
         ram_conn = sqlite3.connect(str(ram_db))
-        ram_conn.row_factory = sqlite3.Row
-        cursor = ram_conn.cursor()
-        cursor.execute("SELECT value FROM test")
-        row = cursor.fetchone()
+        _tune(ram_conn)
+        row = ram_conn.execute("SELECT value FROM test").fetchone()
         ram_conn.close()
 
-        assert row["value"] == "newer_data"
+        assert row[0] == "newer_data"
 
 
 class TestWriteFailureHandling:
     """Test handling of write failures in dual-write mode."""
 
-    def test_disk_write_failure_logged(self, test_config: dict, capsys):
+    def test_disk_write_failure_logged(self, tmp_path: Path, capsys):
         """Test that disk write failures are logged but don't crash."""
-        disk_dir = test_config["disk_data_dir"]
-        disk_dir.mkdir(parents=True, exist_ok=True)
-
-        disk_db = test_config["disk_db_path"]
-
-        # Create DB
-        conn = sqlite3.connect(str(disk_db))
+        db_path = tmp_path / "hebbian_mind.db"
+        conn = sqlite3.connect(str(db_path))
+        _tune(conn)
         conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, value TEXT)")
         conn.commit()
 
-        # Simulate write that might fail
+        # A read-only handle makes the write fail the way a lost disk would
+        ro_conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
         try:
-            # This should succeed normally
-            conn.execute("INSERT INTO test (value) VALUES (?)", ("test",))
-            conn.commit()
+            ro_conn.execute("INSERT INTO test (value) VALUES (?)", ("test",))
             write_succeeded = True
-        except Exception as e:
+        except sqlite3.Error as e:
             # In production, this would be logged
             print(f"[WARNING] Disk write failed: {e}")
             write_succeeded = False
+        finally:
+            ro_conn.close()
 
+        # The failure was handled and logged; the database is still usable
+        assert write_succeeded is False
+        assert "[WARNING] Disk write failed" in capsys.readouterr().out
+        assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 0
         conn.close()
 
-        # Test passes if write succeeded (expected) or failure was handled
-        assert write_succeeded or not write_succeeded  # Either outcome is handled
-
     def test_continue_on_secondary_write_failure(self):
         """Test that primary write succeeds even if secondary fails."""
         # Simulate dual-write pattern
@@ -383,7 +397,7 @@ class TestWALMode:
         db_path = test_config["disk_db_path"]
         conn = sqlite3.connect(str(db_path))
 
-        # Enable WAL mode
+        # Enable WAL mode the way HebbianMindDatabase does, without _tune forcing it
         conn.execute("PRAGMA journal_mode=WAL")
         result = conn.execute("PRAGMA journal_mode").fetchone()
 
@@ -398,83 +412,71 @@ class TestWALMode:
 
         db_path = test_config["disk_db_path"]
         conn = sqlite3.connect(str(db_path))
+        _tune(conn)
         conn.execute("PRAGMA journal_mode=WAL")
+        # Only file creation is checked here, not durability
+        conn.execute("PRAGMA synchronous=OFF")
         conn.execute("CREATE TABLE test (id INTEGER)")
         conn.execute("INSERT INTO test (id) VALUES (1)")
         conn.commit()
 
-        # WAL files should be created after writes
+        # WAL files should be created after writes; closing the last
+        # connection checkpoints and removes them, so check while open
         wal_path = Path(str(db_path) + "-wal")
         shm_path = Path(str(db_path) + "-shm")
+        wal_exists = wal_path.exists()
+        shm_exists = shm_path.exists()
 
         conn.close()
 
-        # Files may or may not exist depending on checkpoint timing
-        # This test just verifies the paths are correct
-        assert isinstance(wal_path, Path)
-        assert isinstance(shm_path, Path)
+        assert wal_exists
+        assert shm_exists
 
 
 class TestNodesFileLoading:
     """Test loading nodes from JSON file."""
 
-    def test_load_nodes_from_file(self, nodes_file: Path, test_config: dict):
+    def test_load_nodes_from_file(self, nodes_data: list):
         """Test loading nodes from nodes_v2.json."""
-        assert nodes_file.exists()
-
-        with open(nodes_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        nodes = data.get("nodes", data)
+        nodes = nodes_data
         assert isinstance(nodes, list)
         assert len(nodes) > 0
 
-    def test_nodes_have_required_fields(self, nodes_file: Path):
+    def test_nodes_have_required_fields(self, nodes_data: list):
         """Test that nodes have all required fields."""
-        with open(nodes_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        nodes = data.get("nodes", data)
-
-        for node in nodes:
+        for node in nodes_data:
             assert "id" in node or "node_id" in node
-            assert "name" in node
-            assert "category" in node
-            assert "keywords" in node
-            assert "prototype_phrases" in node
+            missing = _REQUIRED_NODE_FIELDS - node.keys()
+            assert not missing, missing
 
-    def test_populate_db_from_nodes_file(self, test_db: sqlite3.Connection, nodes_file: Path):
+    def test_populate_db_from_nodes_file(self, test_db: sqlite3.Connection, nodes_data: list):
         """Test populating database from nodes file."""
-        with open(nodes_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        nodes = data.get("nodes", data)
+        nodes = nodes_data
 
-        for node in nodes:
-            test_db.execute(
-                """
-                INSERT OR IGNORE INTO nodes (node_id, name, category, keywords, prototype_phrases, description, weight)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+        # One prepared statement and one transaction for the whole file
+        with test_db:
+            cursor = test_db.executemany(
+                _INSERT_NODE_SQL,
                 (
-                    node.get("id", node.get("node_id")),
-                    node.get("name", ""),
-                    node.get("category", ""),
-                    json.dumps(node.get("keywords", [])),
-                    json.dumps(node.get("prototype_phrases", [])),
-                    node.get("description", ""),
-                    node.get("weight", 1.0),
+                    (
+                        node.get("id", node.get("node_id")),
+                        node.get("name", ""),
+                        node.get("category", ""),
+                        json.dumps(node["keywords"]) if "keywords" in node else _EMPTY_JSON_ARRAY,
+                        (
+                            json.dumps(node["prototype_phrases"])
+                            if "prototype_phrases" in node
+                            else _EMPTY_JSON_ARRAY
+                        ),
+                        node.get("description", ""),
+                        node.get("weight", 1.0),
+                    )
+                    for node in nodes
                 ),
             )
 
-        test_db.commit()
-
-        # Verify nodes were inserted
-        cursor = test_db.cursor()
-        cursor.execute("SELECT COUNT(*) FROM nodes")
-        count = cursor.fetchone()[0]
-
-        assert count == len(nodes)
+        # Verify nodes were inserted; executemany sums rowcount over all rows
+        assert cursor.rowcount == len(nodes)
 
 
 @pytest.mark.slow
@@ -513,24 +515,22 @@ class TestDataIntegrity:
         cursor.execute("SELECT id FROM nodes LIMIT 1")
         valid_id = cursor.fetchone()["id"]
 
-        # Insert valid memory activation
-        populated_db.execute(
-            """
-            INSERT INTO memories (memory_id, content, summary)
-            VALUES (?, ?, ?)
-        """,
-            ("mem_fk_test", "Test content", "Summary"),
-        )
-
-        populated_db.execute(
-            """
-            INSERT INTO memory_activations (memory_id, node_id, activation_score)
-            VALUES (?, ?, ?)
-        """,
-            ("mem_fk_test", valid_id, 0.5),
-        )
-
-        populated_db.commit()
+        # Insert valid memory activation (memory and activation in one transaction)
+        with populated_db:
+            populated_db.execute(
+                """
+                INSERT INTO memories (memory_id, content, summary)
+                VALUES (?, ?, ?)
+            """,
+                ("mem_fk_test", "Test content", "Summary"),
+            )
+            populated_db.execute(
+                """
+                INSERT INTO memory_activations (memory_id, node_id, activation_score)
+                VALUES (?, ?, ?)
+            """,
+                ("mem_fk_test", valid_id, 0.5),
+            )
 
         # Verify insertion succeeded
         cursor.execute(
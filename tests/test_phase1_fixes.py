@@ -15,11 +15,85 @@ Covers:
 Copyright (c) 2026 CIPS LLC
 """
 
-import inspect
+import ast
+import re
 from pathlib import Path
 
 import pytest
 
+# "except:" or "except :" with anything after the colon; ".*" also swallows a CRLF "\r"
+_BARE_EXCEPT_RE = re.compile(r"^[ \t]*except[ \t]*:.*$", re.MULTILINE)
+_ASYNCIO_IMPORT_RE = re.compile(r"^import asyncio\b", re.MULTILINE)
+_PROJECT_VERSION_RE = re.compile(
+    r'^\[project\]$[^\[]*?^version\s*=\s*"([^"]+)"', re.MULTILINE | re.DOTALL
+)
+
+
+def _bare_excepts(source: str) -> tuple:
+    """Return "line N: ..." entries for each bare 'except:' line in source."""
+    found = []
+    for match in _BARE_EXCEPT_RE.finditer(source):
+        line_no = source.count("\n", 0, match.start()) + 1
+        found.append(f"line {line_no}: {match.group().strip()}")
+    return tuple(found)
+
+
+@pytest.fixture(scope="session")
+def server_bare_excepts(server_src) -> tuple:
+    """Bare 'except:' lines in server.py, found once per session."""
+    return _bare_excepts(server_src.text)
+
+
+@pytest.fixture(scope="session")
+def decay_bare_excepts(decay_src) -> tuple:
+    """Bare 'except:' lines in decay.py, found once per session."""
+    return _bare_excepts(decay_src.text)
+
+
+@pytest.fixture(scope="session")
+def inline_asyncio_imports(server_src) -> tuple:
+    """'import asyncio' statements in server.py below module level, found once per session."""
+    tree = server_src.tree
+    top_level = {id(node) for node in tree.body}
+    return tuple(
+        f"line {node.lineno}"
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Import)
+        and id(node) not in top_level
+        and any(alias.name == "asyncio" for alias in node.names)
+    )
+
+
+@pytest.fixture(scope="session")
+def pyproject_version() -> str:
+    """[project].version from pyproject.toml, parsed once per session."""
+    content = (Path(__file__).parent.parent / "pyproject.toml").read_text(encoding="utf-8")
+    try:
+        import tomllib
+    except ModuleNotFoundError:  # Python 3.10
+        match = _PROJECT_VERSION_RE.search(content)
+        return match.group(1) if match else ""
+    return tomllib.loads(content)["project"]["version"]
+
+
+@pytest.fixture(scope="session")
+def method_src(server_src, decay_src) -> dict:
+    """Source of each method under test, keyed "Class.method", sliced from the cached ASTs."""
+    methods = {}
+    for src, class_name in (
+        (server_src, "HebbianMindDatabase"),
+        (decay_src, "HebbianDecayEngine"),
+    ):
+        for node in src.tree.body:
+            if isinstance(node, ast.ClassDef) and node.name == class_name:
+                for child in node.body:
+                    if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        methods[f"{class_name}.{child.name}"] = ast.get_source_segment(
+                            src.text, child
+                        )
+    return methods
+
+
 # ============ C2: UUID Memory IDs ============
 
 
@@ -28,31 +102,27 @@ class TestUUIDMemoryIds:
 
     def test_memory_id_format(self):
         """Memory ID should use UUID hex, not timestamp+hash%10000."""
-        # Import the module source and check the pattern
-        from hebbian_mind.server import uuid
+        from hebbian_mind.server import _new_memory_id
 
-        mid = f"hebbian_mind_{uuid.uuid4().hex[:16]}"
+        mid = _new_memory_id()
         assert mid.startswith("hebbian_mind_")
         # The UUID part should be 16 hex chars
         hex_part = mid.split("_", 2)[2]
         assert len(hex_part) == 16
-        assert all(c in "0123456789abcdef" for c in hex_part)
+        # fromhex raises ValueError on non-hex; 8 bytes rules out embedded spaces
+        assert hex_part == hex_part.lower() and len(bytes.fromhex(hex_part)) == 8
 
     def test_no_collision_in_1000_ids(self):
         """1000 rapid-fire IDs should all be unique."""
-        import uuid
+        from hebbian_mind.server import _new_memory_id
 
-        ids = set()
-        for _ in range(1000):
-            mid = f"hebbian_mind_{uuid.uuid4().hex[:16]}"
-            ids.add(mid)
-        assert len(ids) == 1000
+        ids = [_new_memory_id() for _ in range(1000)]
+        # Birthday bound: P(collision) ~= 1000**2 / 2**65, about 2.7e-14
+        assert len(set(ids)) == len(ids) == 1000
 
-    def test_no_insert_or_replace(self):
+    def test_no_insert_or_replace(self, method_src):
         """save_memory should not use INSERT OR REPLACE."""
-        import hebbian_mind.server as srv
-
-        source = inspect.getsource(srv.HebbianMindDatabase.save_memory)
+        source = method_src["HebbianMindDatabase.save_memory"]
         assert "INSERT OR REPLACE" not in source
         assert "INSERT INTO memories" in source
 
@@ -63,33 +133,25 @@ class TestUUIDMemoryIds:
 class TestThreadingLock:
     """Verify HebbianMindDatabase has a threading lock."""
 
-    def test_lock_exists(self):
+    def test_lock_exists(self, method_src):
         """Database class should have _lock attribute."""
-        from hebbian_mind.server import HebbianMindDatabase
-
-        source = inspect.getsource(HebbianMindDatabase.__init__)
+        source = method_src["HebbianMindDatabase.__init__"]
         assert "_lock" in source
         assert "threading.RLock()" in source
 
-    def test_dual_write_uses_lock(self):
+    def test_dual_write_uses_lock(self, method_src):
         """_dual_write should acquire _lock."""
-        from hebbian_mind.server import HebbianMindDatabase
-
-        source = inspect.getsource(HebbianMindDatabase._dual_write)
+        source = method_src["HebbianMindDatabase._dual_write"]
         assert "self._lock" in source
 
-    def test_save_memory_uses_lock(self):
+    def test_save_memory_uses_lock(self, method_src):
         """save_memory should acquire _lock."""
-        from hebbian_mind.server import HebbianMindDatabase
-
-        source = inspect.getsource(HebbianMindDatabase.save_memory)
+        source = method_src["HebbianMindDatabase.save_memory"]
         assert "self._lock" in source
 
-    def test_query_by_nodes_uses_lock(self):
+    def test_query_by_nodes_uses_lock(self, method_src):
         """query_by_nodes should acquire _lock."""
-        from hebbian_mind.server import HebbianMindDatabase
-
-        source = inspect.getsource(HebbianMindDatabase.query_by_nodes)
+        source = method_src["HebbianMindDatabase.query_by_nodes"]
         assert "self._lock" in source
 
 
@@ -103,28 +165,27 @@ class TestBoundedNodes:
         """get_all_nodes should accept a limit parameter."""
         from hebbian_mind.server import HebbianMindDatabase
 
-        sig = inspect.signature(HebbianMindDatabase.get_all_nodes)
-        assert "limit" in sig.parameters
+        code = HebbianMindDatabase.get_all_nodes.__code__
+        assert "limit" in code.co_varnames[: code.co_argcount]
 
     def test_get_all_nodes_default_limit(self):
         """Default limit should be 10000."""
         from hebbian_mind.server import HebbianMindDatabase
 
-        sig = inspect.signature(HebbianMindDatabase.get_all_nodes)
-        assert sig.parameters["limit"].default == 10000
+        func = HebbianMindDatabase.get_all_nodes
+        names = func.__code__.co_varnames[: func.__code__.co_argcount]
+        defaults = func.__defaults__ or ()
+        default_for = dict(zip(names[len(names) - len(defaults) :], defaults))
+        assert default_for["limit"] == 10000
 
-    def test_get_all_nodes_sql_has_limit(self):
+    def test_get_all_nodes_sql_has_limit(self, method_src):
         """SQL query should include LIMIT clause."""
-        from hebbian_mind.server import HebbianMindDatabase
-
-        source = inspect.getsource(HebbianMindDatabase.get_all_nodes)
+        source = method_src["HebbianMindDatabase.get_all_nodes"]
         assert "LIMIT" in source
 
-    def test_query_by_nodes_clamps_limit(self):
+    def test_query_by_nodes_clamps_limit(self, method_src):
         """query_by_nodes should clamp limit to 1-500."""
-        from hebbian_mind.server import HebbianMindDatabase
-
-        source = inspect.getsource(HebbianMindDatabase.query_by_nodes)
+        source = method_src["HebbianMindDatabase.query_by_nodes"]
         assert "max(1, min(500, limit))" in source
 
 
@@ -134,30 +195,13 @@ class TestBoundedNodes:
 class TestNoBareExcept:
     """Verify no bare except: handlers exist."""
 
-    def test_server_no_bare_except(self):
+    def test_server_no_bare_except(self, server_bare_excepts):
         """server.py should have no bare 'except:' statements."""
-        server_path = Path(__file__).parent.parent / "src" / "hebbian_mind" / "server.py"
-        source = server_path.read_text(encoding="utf-8")
-        # Find all except lines that aren't 'except Exception' or 'except SomeError'
-        lines = source.split("\n")
-        bare_excepts = []
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            if stripped == "except:" or stripped.startswith("except: "):
-                bare_excepts.append(f"line {i}: {stripped}")
-        assert bare_excepts == [], f"Bare except found: {bare_excepts}"
-
-    def test_decay_no_bare_except(self):
+        assert not server_bare_excepts, f"Bare except found: {list(server_bare_excepts)}"
+
+    def test_decay_no_bare_except(self, decay_bare_excepts):
         """decay.py should have no bare 'except:' statements."""
-        decay_path = Path(__file__).parent.parent / "src" / "hebbian_mind" / "decay.py"
-        source = decay_path.read_text(encoding="utf-8")
-        lines = source.split("\n")
-        bare_excepts = []
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            if stripped == "except:" or stripped.startswith("except: "):
-                bare_excepts.append(f"line {i}: {stripped}")
-        assert bare_excepts == [], f"Bare except found: {bare_excepts}"
+        assert not decay_bare_excepts, f"Bare except found: {list(decay_bare_excepts)}"
 
 
 # ============ H3: Input Validation ============
@@ -249,21 +293,24 @@ class TestInputValidation:
 class TestSaveMemoryErrorContext:
     """Verify save_memory raises RuntimeError with details."""
 
-    def test_save_memory_raises_on_failure(self):
+    def test_save_memory_raises_on_failure(self, method_src):
         """save_memory should raise RuntimeError, not return False."""
-        from hebbian_mind.server import HebbianMindDatabase
-
-        source = inspect.getsource(HebbianMindDatabase.save_memory)
+        source = method_src["HebbianMindDatabase.save_memory"]
         assert "raise RuntimeError" in source
         assert "return False" not in source
 
-    def test_save_memory_error_includes_memory_id(self):
+    def test_save_memory_error_includes_memory_id(self, method_src):
         """RuntimeError message should include memory_id."""
-        from hebbian_mind.server import HebbianMindDatabase
-
-        source = inspect.getsource(HebbianMindDatabase.save_memory)
+        source = method_src["HebbianMindDatabase.save_memory"]
         assert "memory_id=" in source
 
+    def test_save_memory_stamps_last_activated_with_epoch(self, method_src):
+        """save_memory should stamp nodes.last_activated with its time.time() epoch."""
+        source = method_src["HebbianMindDatabase.save_memory"]
+        assert "now = time.time()" in source
+        assert "last_activated = ?" in source
+        assert "last_activated = CURRENT_TIMESTAMP" not in source
+
 
 # ============ H6: Decay Dual-Write Order ============
 
@@ -271,11 +318,9 @@ class TestSaveMemoryErrorContext:
 class TestDecayDualWriteOrder:
     """Verify decay writes disk first, then RAM."""
 
-    def test_sweep_memories_disk_first(self):
+    def test_sweep_memories_disk_first(self, method_src):
         """_sweep_memories should write disk before RAM."""
-        from hebbian_mind.decay import HebbianDecayEngine
-
-        source = inspect.getsource(HebbianDecayEngine._sweep_memories)
+        source = method_src["HebbianDecayEngine._sweep_memories"]
         # The comment should say disk first
         assert "disk first" in source.lower()
         # disk_conn.execute should appear before conn.execute in the update block
@@ -287,26 +332,20 @@ class TestDecayDualWriteOrder:
         # Just check the comments are correct
         assert "RAM first" not in source
 
-    def test_sweep_edges_disk_first(self):
+    def test_sweep_edges_disk_first(self, method_src):
         """_sweep_edges should write disk before RAM."""
-        from hebbian_mind.decay import HebbianDecayEngine
-
-        source = inspect.getsource(HebbianDecayEngine._sweep_edges)
+        source = method_src["HebbianDecayEngine._sweep_edges"]
         assert "disk first" in source.lower()
         assert "RAM first" not in source
 
-    def test_touch_memories_disk_first(self):
+    def test_touch_memories_disk_first(self, method_src):
         """touch_memories should write disk before RAM."""
-        from hebbian_mind.decay import HebbianDecayEngine
-
-        source = inspect.getsource(HebbianDecayEngine.touch_memories)
+        source = method_src["HebbianDecayEngine.touch_memories"]
         assert "Disk first" in source or "disk first" in source.lower()
 
-    def test_touch_memories_uses_lock(self):
+    def test_touch_memories_uses_lock(self, method_src):
         """touch_memories should acquire db._lock."""
-        from hebbian_mind.decay import HebbianDecayEngine
-
-        source = inspect.getsource(HebbianDecayEngine.touch_memories)
+        source = method_src["HebbianDecayEngine.touch_memories"]
         assert "self.db._lock" in source
 
 
@@ -316,29 +355,19 @@ class TestDecayDualWriteOrder:
 class TestAsyncioImport:
     """Verify asyncio is imported at module top level."""
 
-    def test_asyncio_in_top_imports(self):
+    def test_asyncio_in_top_imports(self, server_src):
         """asyncio should be imported at the top of server.py, not inline."""
-        server_path = Path(__file__).parent.parent / "src" / "hebbian_mind" / "server.py"
-        source = server_path.read_text(encoding="utf-8")
-        lines = source.split("\n")
         # Check first 40 lines for asyncio import
-        top_section = "\n".join(lines[:40])
-        assert "import asyncio" in top_section
+        source = server_src.text
+        match = _ASYNCIO_IMPORT_RE.search(source)
+        assert match is not None
+        assert source.count("\n", 0, match.start()) < 40
 
-    def test_no_inline_asyncio_import(self):
+    def test_no_inline_asyncio_import(self, inline_asyncio_imports):
         """There should be no 'import asyncio' inside functions."""
-        server_path = Path(__file__).parent.parent / "src" / "hebbian_mind" / "server.py"
-        source = server_path.read_text(encoding="utf-8")
-        lines = source.split("\n")
-        inline_imports = []
-        in_function = False
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            if stripped.startswith("def ") or stripped.startswith("async def "):
-                in_function = True
-            if in_function and stripped == "import asyncio":
-                inline_imports.append(f"line {i}")
-        assert inline_imports == [], f"Inline asyncio imports at: {inline_imports}"
+        assert (
+            not inline_asyncio_imports
+        ), f"Inline asyncio imports at: {list(inline_asyncio_imports)}"
 
 
 # ============ Version Bump ============
@@ -353,8 +382,6 @@ class TestVersionBump:
 
         assert __version__ == "2.3.2"
 
-    def test_pyproject_version(self):
+    def test_pyproject_version(self, pyproject_version):
         """pyproject.toml should have version 2.3.2."""
-        pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
-        content = pyproject_path.read_text(encoding="utf-8")
-        assert 'version = "2.3.2"' in content
+        assert pyproject_version == "2.3.2"
@@ -6,41 +6,64 @@ Copyright (c) 2026 CIPS LLC
 """
 
 import ast
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
 
-def count_test_functions(filepath: Path) -> int:
-    """Count test functions in a Python file."""
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            tree = ast.parse(f.read())
+# Raw bytes, line count and parsed module for each file, read once per run.
+FILE_CACHE: dict[Path, tuple[bytes, int, ast.Module]] = {}
 
-        count = 0
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                if node.name.startswith("test_"):
-                    count += 1
-        return count
-    except Exception as e:
-        print(f"Error parsing {filepath}: {e}")
-        return 0
 
+def _line_count(data: bytes) -> int:
+    """Count lines the way readlines() would, without splitting the data."""
+    return data.count(b"\n") + (bool(data) and not data.endswith(b"\n"))
+
+
+def _load(filepath: Path) -> tuple[bytes, int, ast.Module]:
+    """Read, line-count and parse a Python file, caching the result."""
+    cached = FILE_CACHE.get(filepath)
+    if cached is None:
+        data = filepath.read_bytes()
+        cached = FILE_CACHE[filepath] = (data, _line_count(data), ast.parse(data))
+    return cached
 
-def count_test_classes(filepath: Path) -> int:
-    """Count test classes in a Python file."""
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            tree = ast.parse(f.read())
 
-        count = 0
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
+def count_lines(filepath: Path) -> int:
+    """Count lines in a file, reusing the cached count when it was already loaded."""
+    cached = FILE_CACHE.get(filepath)
+    if cached is not None:
+        return cached[1]
+    return _line_count(filepath.read_bytes())
+
+
+def count_tests(filepath: Path) -> tuple[int, int]:
+    """Count test classes and test functions in a Python file.
+
+    The file is read and parsed once; returns ``(classes, functions)``.
+    """
+    try:
+        tree = _load(filepath)[2]
+
+        # pytest only collects module-level tests and methods of Test*
+        # classes, so there is no need to walk into function bodies.
+        num_classes = 0
+        num_functions = 0
+        for node in tree.body:
+            if isinstance(node, _FUNCTION_NODES):
+                if node.name.startswith("test_"):
+                    num_functions += 1
+            elif isinstance(node, ast.ClassDef):
                 if node.name.startswith("Test"):
-                    count += 1
-        return count
+                    num_classes += 1
+                    for child in node.body:
+                        if isinstance(child, _FUNCTION_NODES) and child.name.startswith("test_"):
+                            num_functions += 1
+        return num_classes, num_functions
     except Exception as e:
         print(f"Error parsing {filepath}: {e}")
-        return 0
+        return 0, 0
 
 
 def main():
@@ -62,11 +85,16 @@ def main():
         "TEST_SUITE_SUMMARY.md",
     ]
 
+    # One directory listing serves the presence checks and the line count below.
+    with os.scandir(tests_dir) as entries:
+        listing = [(entry.name, entry.is_file()) for entry in entries]
+    present = {name for name, _ in listing}
+    py_files = [tests_dir / name for name, is_file in listing if is_file and name.endswith(".py")]
+
     print("\n1. Checking required files...")
     all_present = True
     for filename in required_files:
-        filepath = tests_dir / filename
-        if filepath.exists():
+        if filename in present:
             print(f"   [OK] {filename}")
         else:
             print(f"   [MISSING] {filename}")
@@ -87,17 +115,18 @@ def main():
     total_classes = 0
     total_functions = 0
 
-    for filename in test_files:
-        filepath = tests_dir / filename
-        if filepath.exists():
-            num_classes = count_test_classes(filepath)
-            num_functions = count_test_functions(filepath)
-            total_classes += num_classes
-            total_functions += num_functions
+    # Files are independent; read and parse them concurrently, then report in order.
+    paths = [tests_dir / f for f in test_files if f in present]
+    with ThreadPoolExecutor(max_workers=max(1, min(4, len(paths)))) as executor:
+        results = list(executor.map(count_tests, paths))
+
+    for filepath, (num_classes, num_functions) in zip(paths, results):
+        total_classes += num_classes
+        total_functions += num_functions
 
-            print(f"\n   {filename}:")
-            print(f"     Classes:   {num_classes}")
-            print(f"     Functions: {num_functions}")
+        print(f"\n   {filepath.name}:")
+        print(f"     Classes:   {num_classes}")
+        print(f"     Functions: {num_functions}")
 
     print(f"\n   Total test classes:   {total_classes}")
     print(f"   Total test functions: {total_functions}")
@@ -121,24 +150,25 @@ def main():
     # Count total lines
     print("\n5. Code statistics:")
     total_lines = 0
-    for filepath in tests_dir.glob("*.py"):
-        with open(filepath, "r", encoding="utf-8") as f:
-            lines = len(f.readlines())
-            total_lines += lines
+    for filepath in py_files:
+        total_lines += count_lines(filepath)
 
     print(f"   Total lines of test code: {total_lines}")
 
     # Check fixtures
     print("\n6. Checking conftest.py fixtures...")
     conftest = tests_dir / "conftest.py"
-    if conftest.exists():
-        with open(conftest, "r", encoding="utf-8") as f:
-            tree = ast.parse(f.read())
+    if "conftest.py" in present:
+        tree = _load(conftest)[2]
 
         fixtures = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
+        # Fixtures are module-level functions; only the top level is scanned.
+        for node in tree.body:
+            if isinstance(node, _FUNCTION_NODES):
                 for decorator in node.decorator_list:
+                    # @pytest.fixture(scope=...) wraps the name in a call
+                    if isinstance(decorator, ast.Call):
+                        decorator = decorator.func
                     if isinstance(decorator, ast.Name) and decorator.id == "fixture":
                         fixtures.append(node.name)
                     elif isinstance(decorator, ast.Attribute) and decorator.attr == "fixture":